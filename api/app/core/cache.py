@@ -0,0 +1,129 @@
+"""In-process read cache invalidated by a cheap data version.
+
+Tariff data only changes when an ingest commits, so read endpoints can serve results
+from memory as long as the database "data version" (e.g. the highest tariff id) is
+unchanged. The version itself is re-read at most every ``version_interval`` seconds, and
+entries also expire after ``ttl`` seconds because freshness statuses depend on the clock.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Hashable
+
+from api.app.core.logging import get_logger
+from api.app.core.metrics import CACHE_INVALIDATIONS, CACHE_REQUESTS
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class VersionedCache:
+    """Bounded LRU cache flushed whenever ``version_loader`` returns a new value.
+
+    Example:
+        >>> cache = VersionedCache("tariffs", version_loader=load_data_version)
+        >>> items = await cache.get_or_load(("latest", "BASE", 6), load_latest)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        version_loader: Callable[[], Awaitable[Hashable]],
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        version_interval: float = 2.0,
+    ):
+        """Initialize cache.
+
+        Args:
+            name: Label used in metrics and logs
+            version_loader: Coroutine returning the current data version
+            maxsize: Maximum number of cached keys (least recently used are evicted)
+            ttl: Seconds an entry stays valid even if the version does not change (0 disables)
+            version_interval: Minimum seconds between two ``version_loader`` calls
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version_interval = version_interval
+        self._version_loader = version_loader
+        self._version: Hashable | None = None
+        self._version_checked_at: float | None = None
+        # Wall-clock time this process first saw the current version (HTTP Last-Modified).
+        self.version_changed_at: datetime | None = None
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key`` or await ``loader()`` and cache its result.
+
+        Exceptions from ``loader`` propagate and nothing is cached.
+        """
+        if not self.enabled:
+            return await loader()
+        await self._check_version()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end(key)
+            CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+            return entry.value
+
+        CACHE_REQUESTS.labels(cache=self.name, result="miss").inc()
+        value = await loader()
+        self._entries[key] = _Entry(value=value, expires_at=now + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    async def version(self) -> Hashable | None:
+        """Current data version, re-read at most every ``version_interval`` seconds."""
+        await self._check_version()
+        return self._version
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self._version_checked_at = None
+
+    async def _check_version(self) -> None:
+        now = time.monotonic()
+        if (
+            self._version_checked_at is not None
+            and now - self._version_checked_at < self.version_interval
+        ):
+            return
+        version = await self._version_loader()
+        self._version_checked_at = now
+        if version != self._version:
+            if self._entries:
+                CACHE_INVALIDATIONS.labels(cache=self.name).inc()
+                logger.info("cache_invalidated", cache=self.name, version=str(version))
+            self._entries.clear()
+            self._version = version
+            self.version_changed_at = _next_change_time(self.version_changed_at)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _next_change_time(previous: datetime | None) -> datetime:
+    # HTTP dates have second precision: keep successive versions on distinct seconds so
+    # an If-Modified-Since date never covers a newer version.
+    changed = datetime.now(timezone.utc).replace(microsecond=0)
+    if previous is not None and changed <= previous:
+        changed = previous + timedelta(seconds=1)
+    return changed
@@ -26,6 +26,28 @@ class Settings(BaseSettings):
             "Set to true to use the PostgreSQL persistence layer " "instead of the in-memory seed."
         ),
     )
+    tariff_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="How long tariff read results are cached in memory (0 disables the cache).",
+    )
+    tariff_cache_max_entries: int = Field(
+        default=256, description="Maximum number of cached tariff queries."
+    )
+    tariff_cache_version_interval_seconds: float = Field(
+        default=2.0,
+        description="Minimum delay between two data-version checks against the database.",
+    )
+    compare_cache_max_entries: int = Field(
+        default=128, description="Maximum number of cached /v1/compare rankings."
+    )
+    health_cache_ttl_seconds: float = Field(
+        default=15.0,
+        description="How long /v1/health/ingest reuses its last report (0 disables caching).",
+    )
+    tariff_http_max_age_seconds: int = Field(
+        default=60,
+        description="Cache-Control max-age sent with tariff responses (and their 304s).",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="OPENWATT_",
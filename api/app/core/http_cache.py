@@ -0,0 +1,71 @@
+"""HTTP conditional requests (ETag / Last-Modified / 304) for polled read endpoints.
+
+Routes compute ``Validators`` from a cheap data version before doing any work; when the
+client already holds the current representation the route answers ``304 Not Modified``
+without touching the payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Mapping
+
+from starlette.responses import Response
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self, max_age: int) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={max_age}"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_to_utc(self.last_modified), usegmt=True)
+        return headers
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag (quoted hex digest) over the JSON form of ``parts``."""
+    digest = hashlib.sha256(json.dumps(parts, default=str, sort_keys=True).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def is_not_modified(request_headers: Mapping[str, str], validators: Validators) -> bool:
+    """Evaluate ``If-None-Match`` / ``If-Modified-Since`` as in RFC 9110 section 13.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only looked at when the
+    client sent no entity tag.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, as required for GET/HEAD.
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return validators.etag.removeprefix("W/") in tags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have second precision.
+        last_modified = _to_utc(validators.last_modified).replace(microsecond=0)
+        return last_modified <= _to_utc(since)
+    return False
+
+
+def not_modified_response(validators: Validators, max_age: int) -> Response:
+    return Response(status_code=304, headers=validators.headers(max_age))
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,31 @@
+"""Application-level Prometheus metrics.
+
+HTTP request metrics come from prometheus-fastapi-instrumentator; the collectors below
+are registered in the same default registry, so ``/metrics`` exposes them as well.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Histogram
+
+CACHE_REQUESTS = Counter(
+    "openwatt_cache_requests_total",
+    "Read-cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"],
+)
+CACHE_INVALIDATIONS = Counter(
+    "openwatt_cache_invalidations_total",
+    "Read-cache flushes caused by a data version change",
+    ["cache"],
+)
+DB_QUERIES = Counter(
+    "openwatt_db_queries_total",
+    "SQL statements executed, by service operation",
+    ["operation"],
+)
+DB_QUERY_SECONDS = Histogram(
+    "openwatt_db_query_seconds",
+    "Wall time spent in the database per service operation call",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from api.app.db.base import Base
@@ -41,6 +41,31 @@ class Tariff(Base):
 
     supplier: Mapped[Supplier] = relationship(back_populates="tariffs")
 
+    # Mirrors db/ddl.sql; uq_tariffs_obs is the conflict target of the bulk ingest path.
+    __table_args__ = (
+        Index(
+            "uq_tariffs_obs",
+            "supplier_id",
+            "option",
+            "puissance_kva",
+            "observed_at",
+            "parser_version",
+            "source_checksum",
+            unique=True,
+        ),
+        # One series per offer: serves DISTINCT ON / latest_tariffs in TariffRepository.
+        Index(
+            "idx_tariffs_latest_offer",
+            "supplier_id",
+            "source_url",
+            "option",
+            "puissance_kva",
+            observed_at.desc(),
+        ),
+        # Keyset pagination of /v1/tariffs/history (newest first, id breaks ties).
+        Index("idx_tariffs_history", observed_at.desc(), id.desc()),
+    )
+
 
 class TrveReference(Base):
     __tablename__ = "trve_reference"
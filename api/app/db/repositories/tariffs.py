@@ -1,22 +1,79 @@
 from __future__ import annotations
 
+import base64
+import json
 from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from api.app.db import models
 from api.app.models.enums import FreshnessStatus, TariffOption
 from api.app.models.tariffs import TariffObservation
 
+# Only what a TariffObservation needs, as plain Core rows (no ORM identity map/relationship).
+OBSERVATION_COLUMNS = (
+    models.Supplier.name.label("supplier"),
+    models.Tariff.option,
+    models.Tariff.puissance_kva,
+    models.Tariff.price_kwh_ttc,
+    models.Tariff.price_kwh_hp_ttc,
+    models.Tariff.price_kwh_hc_ttc,
+    models.Tariff.abo_month_ttc,
+    models.Tariff.observed_at,
+    models.Tariff.parser_version,
+    models.Tariff.source_url,
+    models.Tariff.source_checksum,
+    models.Tariff.notes,
+    models.Tariff.id,
+)
+HISTORY_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 500
+
+
+def _as_float(value: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
+def encode_cursor(observed_at: datetime, tariff_id: int) -> str:
+    """Opaque keyset cursor pointing just after the (observed_at, id) row."""
+    raw = json.dumps([observed_at.isoformat(), tariff_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        observed_at, tariff_id = json.loads(raw)
+        return datetime.fromisoformat(observed_at), int(tariff_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid history cursor: {cursor!r}") from exc
+
 
 class TariffRepository:
-    """Read-only helpers mapping ORM rows to API payloads."""
+    """Read-only helpers mapping database rows to API payloads."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def data_version(self) -> tuple:
+        """Cheap fingerprint of everything the read endpoints depend on.
+
+        Changes whenever tariffs are inserted, an ingest run finishes (``last_verified``)
+        or the TRVE reference is re-imported; used to invalidate the read cache. The second
+        item, the latest ingest ``finished_at``, also bounds the HTTP ``Last-Modified``.
+        """
+        stmt = select(
+            select(func.max(models.Tariff.id)).scalar_subquery(),
+            select(func.max(models.IngestRun.finished_at)).scalar_subquery(),
+            select(func.max(models.TrveReference.id)).scalar_subquery(),
+            select(func.count(models.TrveReference.id)).scalar_subquery(),
+        )
+        result = await self.session.execute(stmt)
+        return tuple(result.one())
+
     async def fetch_latest(
         self,
         *,
@@ -24,34 +81,100 @@ class TariffRepository:
         puissance: int | None = None,
         include_stale: bool = False,
     ) -> list[TariffObservation]:
-        stmt = (
-            select(models.Tariff)
-            .join(models.Supplier)
-            .options(selectinload(models.Tariff.supplier))
+        stmt = self._latest_per_offer(option=option, puissance=puissance)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        verified = await self._last_verified_by_source()
+        return [
+            obs
+            for obs in self._to_observations(rows, verified)
+            if include_stale
+            or obs.data_status not in {FreshnessStatus.STALE, FreshnessStatus.BROKEN}
+        ]
+
+    def _latest_per_offer(self, *, option: TariffOption | None, puissance: int | None):
+        """Select the most recent row of every offer, whatever the history depth.
+
+        An offer is one (supplier, source_url, option, puissance) series: suppliers such as
+        MintEnergie publish several offers under the same name. Postgres resolves this with
+        ``DISTINCT ON`` over ``idx_tariffs_latest_offer``; other backends (SQLite in tests)
+        use the same ``row_number()`` window as the ``latest_tariffs`` view.
+        """
+        offer = (
+            models.Tariff.supplier_id,
+            models.Tariff.source_url,
+            models.Tariff.option,
+            models.Tariff.puissance_kva,
         )
+        filters = []
         if option:
-            stmt = stmt.where(models.Tariff.option == option)
+            filters.append(models.Tariff.option == option)
         if puissance:
-            stmt = stmt.where(models.Tariff.puissance_kva == puissance)
-        stmt = stmt.order_by(models.Tariff.observed_at.desc()).limit(512)
-        result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        observations: list[TariffObservation] = []
-        for row in rows:
-            obs = self._to_observation(row)
-            if include_stale or obs.data_status not in {
-                FreshnessStatus.STALE,
-                FreshnessStatus.BROKEN,
-            }:
-                observations.append(obs)
-        return observations
-
-    async def fetch_history(self, filters: dict) -> list[TariffObservation]:
-        stmt = (
-            select(models.Tariff)
+            filters.append(models.Tariff.puissance_kva == puissance)
+        latest_first = (models.Tariff.observed_at.desc(), models.Tariff.id.desc())
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            latest = (
+                select(models.Tariff.id)
+                .where(*filters)
+                .distinct(*offer)
+                .order_by(*offer, *latest_first)
+                .subquery()
+            )
+            is_latest = latest.c.id == models.Tariff.id
+        else:
+            latest = (
+                select(
+                    models.Tariff.id,
+                    func.row_number().over(partition_by=offer, order_by=latest_first).label("rn"),
+                )
+                .where(*filters)
+                .subquery()
+            )
+            is_latest = (latest.c.id == models.Tariff.id) & (latest.c.rn == 1)
+        return (
+            select(*OBSERVATION_COLUMNS)
+            .select_from(models.Tariff)
             .join(models.Supplier)
-            .options(selectinload(models.Tariff.supplier))
+            .join(latest, is_latest)
+            .order_by(*latest_first)
         )
+
+    async def fetch_history(
+        self,
+        filters: dict,
+        *,
+        limit: int = HISTORY_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[TariffObservation], str | None]:
+        """One page of history, newest first, plus the cursor of the next page (if any)."""
+        stmt = self._history_stmt(filters, cursor=cursor).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].observed_at, rows[-1].id)
+        verified = await self._last_verified_by_source()
+        return self._to_observations(rows, verified), next_cursor
+
+    async def stream_history(
+        self, filters: dict, *, cursor: str | None = None
+    ) -> AsyncIterator[TariffObservation]:
+        """Yield every matching observation through a server-side cursor."""
+        verified = await self._last_verified_by_source()
+        now = datetime.now(timezone.utc)
+        stmt = self._history_stmt(filters, cursor=cursor).execution_options(
+            yield_per=STREAM_BATCH_SIZE
+        )
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            for row in partition:
+                key = (row.source_url, row.source_checksum)
+                yield self._to_observation(row, verified.get(key), now=now)
+
+    def _history_stmt(self, filters: dict, *, cursor: str | None = None) -> Select:
+        stmt = select(*OBSERVATION_COLUMNS).select_from(models.Tariff).join(models.Supplier)
         if supplier := filters.get("supplier"):
             stmt = stmt.where(models.Supplier.name == supplier)
         if option := filters.get("option"):
@@ -68,49 +191,112 @@ class TariffRepository:
                 models.Tariff.observed_at
                 <= datetime.combine(until, datetime.max.time(), tzinfo=timezone.utc)
             )
-        stmt = stmt.order_by(models.Tariff.observed_at.desc()).limit(1024)
+        if cursor:
+            # Keyset: strictly after the last row of the previous page (idx_tariffs_history).
+            stmt = stmt.where(
+                tuple_(models.Tariff.observed_at, models.Tariff.id) < decode_cursor(cursor)
+            )
+        return stmt.order_by(models.Tariff.observed_at.desc(), models.Tariff.id.desc())
+
+    async def _last_verified_by_source(self) -> dict[tuple[str, str], datetime]:
+        """Latest ingest run confirming each (source_url, checksum) artifact is still current.
+
+        Unchanged sources are no longer re-inserted, so freshness must also account for
+        runs that verified the artifact without writing new observations.
+        """
+        stmt = (
+            select(
+                models.IngestRun.source_url,
+                models.IngestRun.source_checksum,
+                func.max(models.IngestRun.finished_at),
+            )
+            .where(
+                models.IngestRun.status.in_(("success", "unchanged")),
+                models.IngestRun.source_url.is_not(None),
+                models.IngestRun.source_checksum.is_not(None),
+                models.IngestRun.finished_at.is_not(None),
+            )
+            .group_by(models.IngestRun.source_url, models.IngestRun.source_checksum)
+        )
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        return [self._to_observation(row) for row in rows]
+        verified: dict[tuple[str, str], datetime] = {}
+        for source_url, checksum, finished_at in result.all():
+            if finished_at.tzinfo is None:
+                finished_at = finished_at.replace(tzinfo=timezone.utc)
+            verified[(source_url, checksum)] = finished_at
+        return verified
+
+    def _to_observation(
+        self,
+        row: Row,
+        last_verified: datetime | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> TariffObservation:
+        """Map a row selected with ``OBSERVATION_COLUMNS``.
 
-    def _to_observation(self, row: models.Tariff) -> TariffObservation:
-        observed_at = row.observed_at
+        Validation stays on: with pydantic-core, ``model_validate`` from a dict of typed
+        values is no slower than ``model_construct``, which loops over the fields in Python.
+        """
+        # Positional unpacking: Row attribute access goes through a per-name key lookup.
+        (
+            supplier,
+            option,
+            puissance_kva,
+            price_kwh_ttc,
+            price_kwh_hp_ttc,
+            price_kwh_hc_ttc,
+            abo_month_ttc,
+            observed_at,
+            parser_version,
+            source_url,
+            source_checksum,
+            notes,
+            _tariff_id,
+        ) = row
         if observed_at.tzinfo is None:
             observed_at = observed_at.replace(tzinfo=timezone.utc)
-        return TariffObservation(
-            supplier=row.supplier.name if row.supplier else "unknown",
-            option=row.option,
-            puissance_kva=row.puissance_kva,
-            price_kwh_ttc=float(row.price_kwh_ttc) if row.price_kwh_ttc is not None else None,
-            price_kwh_hp_ttc=(
-                float(row.price_kwh_hp_ttc) if row.price_kwh_hp_ttc is not None else None
-            ),
-            price_kwh_hc_ttc=(
-                float(row.price_kwh_hc_ttc) if row.price_kwh_hc_ttc is not None else None
-            ),
-            abo_month_ttc=float(row.abo_month_ttc),
-            observed_at=observed_at,
-            parser_version=row.parser_version,
-            source_url=row.source_url,
-            source_checksum=row.source_checksum,
-            data_status=self._derive_status(row),
-            last_verified=None,
-        )
+        fields = {
+            "supplier": supplier or "unknown",
+            "option": TariffOption(option),
+            "puissance_kva": puissance_kva,
+            "price_kwh_ttc": _as_float(price_kwh_ttc),
+            "price_kwh_hp_ttc": _as_float(price_kwh_hp_ttc),
+            "price_kwh_hc_ttc": _as_float(price_kwh_hc_ttc),
+            "abo_month_ttc": float(abo_month_ttc),
+            "observed_at": observed_at,
+            "parser_version": parser_version,
+            "source_url": source_url,
+            "source_checksum": source_checksum,
+            "data_status": self._derive_status(observed_at, notes, last_verified, now=now),
+            "last_verified": last_verified,
+        }
+        return TariffObservation.model_validate(fields)
 
-    def _derive_status(self, row: models.Tariff) -> FreshnessStatus:
+    def _to_observations(
+        self, rows: list[Row], verified: dict[tuple[str, str], datetime]
+    ) -> list[TariffObservation]:
         now = datetime.now(timezone.utc)
-        observed_at = row.observed_at
-        if observed_at.tzinfo is None:
-            observed_at = observed_at.replace(tzinfo=timezone.utc)
-        if row.notes and "broken" in row.notes.lower():
+        return [
+            self._to_observation(row, verified.get((row.source_url, row.source_checksum)), now=now)
+            for row in rows
+        ]
+
+    def _derive_status(
+        self,
+        observed_at: datetime,
+        notes: str | None,
+        last_verified: datetime | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> FreshnessStatus:
+        now = now or datetime.now(timezone.utc)
+        checked_at = max(observed_at, last_verified) if last_verified else observed_at
+        if notes and "broken" in notes.lower():
             return FreshnessStatus.BROKEN
-        if (
-            row.notes
-            and "validation" in row.notes.lower()
-            and (now - observed_at) <= timedelta(hours=48)
-        ):
+        if notes and "validation" in notes.lower() and (now - observed_at) <= timedelta(hours=48):
             return FreshnessStatus.VERIFYING
-        if now - observed_at > timedelta(days=14):
+        if now - checked_at > timedelta(days=14):
             return FreshnessStatus.STALE
         return FreshnessStatus.FRESH
 
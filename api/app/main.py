@@ -10,7 +10,7 @@ from api.app.core.config import settings
 from api.app.core.logging import configure_logging, get_logger
 from api.app.core.sentry import configure_sentry
 from api.app.middleware import RequestIDMiddleware
-from api.app.routes import admin, guards, health, tariffs
+from api.app.routes import admin, compare, guards, health, tariffs
 
 # Configure structured logging and Sentry on startup
 configure_logging()
@@ -76,4 +76,5 @@ async def shutdown_event() -> None:
 app.include_router(health.router)
 app.include_router(tariffs.router)
 app.include_router(guards.router)
+app.include_router(compare.router)
 app.include_router(admin.router)
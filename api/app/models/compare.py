@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+from api.app.models.enums import Puissance, TariffOption
+from api.app.models.tariffs import TariffObservation
+
+
+class ConsumptionProfile(BaseModel):
+    consumption_kwh: float = Field(..., gt=0, description="Consommation annuelle (kWh/an)")
+    hc_share: float = Field(
+        default=40.0, ge=0, le=100, description="Part heures creuses (%), offres HPHC"
+    )
+    puissance_kva: Puissance | None = None
+    option: TariffOption | None = None
+
+
+class RankedOffer(BaseModel):
+    rank: int
+    annual_cost_eur: float = Field(..., description="Abonnement x 12 + energie, TTC")
+    offer: TariffObservation
+
+
+class CompareResponse(BaseModel):
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    profile: ConsumptionProfile
+    total_offers: int = Field(..., description="Offres classees avant troncature a `top`")
+    items: list[RankedOffer]
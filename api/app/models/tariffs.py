@@ -41,6 +41,9 @@ class TariffHistoryFilters(BaseModel):
 class TariffHistoryResponse(BaseModel):
     filters: TariffHistoryFilters
     items: list[TariffObservation]
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `cursor` to fetch the next (older) page"
+    )
 
 
 class TrveDiffEntry(BaseModel):
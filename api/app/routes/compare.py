@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Query
+
+from api.app.core.config import settings
+from api.app.models.compare import CompareResponse, ConsumptionProfile
+from api.app.models.enums import Puissance, TariffOption
+from api.app.services import compare_service
+
+router = APIRouter(prefix=settings.api_v1_prefix, tags=["compare"])
+
+
+@router.get("/compare", response_model=CompareResponse, summary="Classement par cout annuel")
+async def compare_offers(
+    consumption_kwh: float = Query(..., gt=0, le=1_000_000, description="Consommation (kWh/an)"),
+    hc_share: float = Query(default=40.0, ge=0, le=100, description="Part heures creuses (%)"),
+    puissance: Puissance | None = Query(default=None, description="Puissance souscrite (kVA)"),
+    option: TariffOption | None = Query(default=None),
+    top: int = Query(default=compare_service.DEFAULT_TOP, ge=1, le=100),
+) -> CompareResponse:
+    """Rank the latest fresh offers by annual cost for one consumption profile."""
+    profile = ConsumptionProfile(
+        consumption_kwh=consumption_kwh, hc_share=hc_share, puissance_kva=puissance, option=option
+    )
+    return await compare_service.compare_offers(profile, top=top)
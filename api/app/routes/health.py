@@ -14,6 +14,16 @@ from api.app.services.health_service import HealthService
 router = APIRouter(tags=["health"])
 logger = get_logger(__name__)
 
+# One instance per process so its short-lived report cache is shared by all pollers.
+_ingest_health_service: HealthService | None = None
+
+
+def _get_ingest_health_service() -> HealthService:
+    global _ingest_health_service
+    if _ingest_health_service is None:
+        _ingest_health_service = HealthService()
+    return _ingest_health_service
+
 
 @router.get("/health", summary="Health probe", description="Basic uptime signal for monitoring.")
 async def health_probe() -> dict[str, str]:
@@ -34,5 +44,4 @@ async def health_probe() -> dict[str, str]:
 async def ingest_health() -> dict[str, Any]:
     """Return health status of ingest pipeline."""
     logger.debug("ingest_health_check_requested")
-    service = HealthService()
-    return await service.get_ingest_health()
+    return await _get_ingest_health_service().get_ingest_health()
@@ -1,10 +1,13 @@
 ﻿from __future__ import annotations
 
 from datetime import date
+from typing import Literal
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from api.app.core.config import settings
+from api.app.core.http_cache import is_not_modified, not_modified_response
 from api.app.models.tariffs import (
     TariffCollection,
     TariffHistoryFilters,
@@ -14,12 +17,15 @@ from api.app.models.tariffs import (
 from api.app.services import tariff_service
 
 PUISSANCE_VALUES = [3, 6, 9, 12, 15, 18, 24, 30, 36]
+MAX_HISTORY_PAGE_SIZE = 5000
 
 router = APIRouter(prefix=settings.api_v1_prefix, tags=["tariffs"])
 
 
 @router.get("/tariffs", response_model=TariffCollection, summary="Derniers tarifs frais")
 async def get_latest_tariffs(
+    request: Request,
+    response: Response,
     option: TariffOption | None = Query(default=None, description="Filtrer par option tarifaire"),
     puissance: int | None = Query(
         default=None,
@@ -31,8 +37,15 @@ async def get_latest_tariffs(
         default=False,
         description="Inclure les observations marquees stale/broken pour audit",
     ),
-) -> TariffCollection:
+) -> TariffCollection | Response:
     """Expose `/v1/tariffs` tel que decrit dans `specs/api.md`."""
+    validators = await tariff_service.fetch_validators(
+        "latest", option.value if option else None, puissance, include_stale
+    )
+    if validators is not None:
+        if is_not_modified(request.headers, validators):
+            return not_modified_response(validators, settings.tariff_http_max_age_seconds)
+        response.headers.update(validators.headers(settings.tariff_http_max_age_seconds))
     return await tariff_service.fetch_latest_tariffs(
         option=option, puissance=puissance, include_stale=include_stale
     )
@@ -44,6 +57,8 @@ async def get_latest_tariffs(
     summary="Historique insert-only",
 )
 async def get_tariff_history(
+    request: Request,
+    response: Response,
     supplier: str | None = Query(default=None, description="Filtrer par fournisseur"),
     option: TariffOption | None = Query(default=None),
     puissance: int | None = Query(default=None, ge=min(PUISSANCE_VALUES), le=max(PUISSANCE_VALUES)),
@@ -53,7 +68,15 @@ async def get_tariff_history(
     until: date | None = Query(
         default=None, description="Inclure les observations jusqu'a cette date"
     ),
-) -> TariffHistoryResponse:
+    cursor: str | None = Query(
+        default=None, description="Curseur `next_cursor` de la page precedente"
+    ),
+    limit: int = Query(default=tariff_service.HISTORY_PAGE_SIZE, ge=1, le=MAX_HISTORY_PAGE_SIZE),
+    format: Literal["json", "ndjson", "csv"] = Query(
+        default="json",
+        description="`ndjson`/`csv` : export complet en streaming (ignore `limit`)",
+    ),
+) -> TariffHistoryResponse | Response:
     filters = TariffHistoryFilters(
         supplier=supplier,
         option=option,
@@ -61,4 +84,24 @@ async def get_tariff_history(
         since=since,
         until=until,
     )
-    return await tariff_service.fetch_history(filters)
+    validators = await tariff_service.fetch_validators(
+        "history", filters.model_dump(exclude_none=True, mode="json"), cursor, limit, format
+    )
+    headers: dict[str, str] = {}
+    if validators is not None:
+        if is_not_modified(request.headers, validators):
+            return not_modified_response(validators, settings.tariff_http_max_age_seconds)
+        headers = validators.headers(settings.tariff_http_max_age_seconds)
+        response.headers.update(headers)
+    try:
+        if format != "json":
+            # Rows are written as the DB cursor yields them: constant memory, first bytes
+            # sent right away.
+            return StreamingResponse(
+                tariff_service.stream_history(filters, output_format=format, cursor=cursor),
+                media_type=tariff_service.HISTORY_EXPORT_MEDIA_TYPES[format],
+                headers=headers,
+            )
+        return await tariff_service.fetch_history(filters, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -0,0 +1,115 @@
+"""Annual cost ranking of the latest offers for a consumption profile.
+
+Mirrors ``computeAnnualCost`` in ``ui/components/TariffList.tsx``: subscription x 12 plus
+energy, with HP/HC consumption split by ``hc_share`` for HPHC offers and missing prices
+falling back to the other price columns. Costs for the whole catalog are computed in one
+vectorized NumPy pass, and ranked results are cached per profile in their own bounded
+cache, invalidated by the same data version as the tariff reads.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence
+
+import numpy as np
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.app.core.cache import VersionedCache
+from api.app.core.config import settings
+from api.app.models.compare import CompareResponse, ConsumptionProfile, RankedOffer
+from api.app.models.enums import TariffOption
+from api.app.models.tariffs import TariffObservation
+from api.app.services import tariff_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP = 10
+
+# Keyed by free-form profiles (consumption, HC share...), so kept apart from
+# ``tariff_cache``: a burst of distinct profiles must not evict the tariff reads.
+compare_cache = VersionedCache(
+    "compare",
+    version_loader=tariff_service.load_data_version,
+    maxsize=settings.compare_cache_max_entries,
+    ttl=settings.tariff_cache_ttl_seconds,
+    version_interval=settings.tariff_cache_version_interval_seconds,
+)
+
+
+def _column(observations: Sequence[TariffObservation], name: str) -> np.ndarray:
+    return np.array(
+        [np.nan if (value := getattr(obs, name)) is None else value for obs in observations],
+        dtype=np.float64,
+    )
+
+
+def _fallback(*columns: np.ndarray) -> np.ndarray:
+    """First non-NaN value per row across ``columns`` (NaN if all are missing)."""
+    result = columns[0].copy()
+    for column in columns[1:]:
+        result = np.where(np.isnan(result), column, result)
+    return result
+
+
+def annual_costs(
+    observations: Sequence[TariffObservation], *, consumption_kwh: float, hc_share: float
+) -> np.ndarray:
+    """Annual cost (EUR TTC) of every observation for the given consumption profile."""
+    if not observations:
+        return np.empty(0, dtype=np.float64)
+    options = np.array([TariffOption(obs.option).value for obs in observations])
+    abo = np.nan_to_num(_column(observations, "abo_month_ttc")) * 12
+    base = _column(observations, "price_kwh_ttc")
+    hp = _column(observations, "price_kwh_hp_ttc")
+    hc = _column(observations, "price_kwh_hc_ttc")
+
+    hp_price = np.nan_to_num(_fallback(hp, base))
+    hc_price = _fallback(hc, base, hp_price)
+    base_price = np.nan_to_num(_fallback(base, hp))
+    hc_consumption = consumption_kwh * hc_share / 100
+    hp_consumption = consumption_kwh - hc_consumption
+
+    energy = np.select(
+        [
+            options == TariffOption.HPHC.value,
+            np.isin(options, (TariffOption.BASE.value, TariffOption.TEMPO.value)),
+        ],
+        [hp_consumption * hp_price + hc_consumption * hc_price, consumption_kwh * base_price],
+        default=0.0,
+    )
+    return abo + energy
+
+
+def rank_offers(
+    observations: Sequence[TariffObservation], profile: ConsumptionProfile, *, top: int
+) -> CompareResponse:
+    costs = annual_costs(
+        observations, consumption_kwh=profile.consumption_kwh, hc_share=profile.hc_share
+    )
+    # Stable sort keeps the catalog order between offers of equal cost.
+    order = np.argsort(costs, kind="stable")[:top]
+    items = [
+        RankedOffer(
+            rank=rank, annual_cost_eur=round(float(costs[index]), 2), offer=observations[index]
+        )
+        for rank, index in enumerate(order, start=1)
+    ]
+    return CompareResponse(profile=profile, total_offers=len(observations), items=items)
+
+
+async def compare_offers(profile: ConsumptionProfile, *, top: int = DEFAULT_TOP) -> CompareResponse:
+    async def _compute() -> CompareResponse:
+        collection = await tariff_service.fetch_latest_tariffs(
+            option=profile.option, puissance=profile.puissance_kva
+        )
+        return rank_offers(collection.items, profile, top=top)
+
+    if not settings.enable_db:
+        return await _compute()
+    key = (*sorted(profile.model_dump(mode="json").items()), top)
+    try:
+        return await compare_cache.get_or_load(key, _compute)
+    except SQLAlchemyError as exc:
+        logger.warning("DB compare cache lookup failed, ranking without cache: %s", exc)
+        return await _compute()
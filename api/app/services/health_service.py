@@ -1,154 +1,201 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
 
-from sqlalchemy import select, and_
+from sqlalchemy import case, event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from api.app.core.config import settings
+from api.app.core.metrics import CACHE_REQUESTS, DB_QUERIES, DB_QUERY_SECONDS
 from api.app.db.models import IngestRun
 from api.app.db.session import get_session_factory
 from api.app.core.logging import get_logger
+from parsers.core.config import get_config_registry
 
 logger = get_logger(__name__)
 
+SUCCESS_STATUSES = ("success", "unchanged")
+FAILURE_STATUSES = ("failed", "source_unavailable")
+
 
 class HealthService:
     """Service for checking ingest health status."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        cache_ttl: float | None = None,
+    ):
+        """Initialize service.
+
+        Args:
+            session_factory: Session factory (defaults to the application one)
+            cache_ttl: Seconds a computed report is served again (0 disables caching)
+        """
         self.session_factory = session_factory or get_session_factory()
+        self.cache_ttl = settings.health_cache_ttl_seconds if cache_ttl is None else cache_ttl
+        self._cached: tuple[float, dict[str, Any]] | None = None
 
     async def get_ingest_health(self) -> dict[str, Any]:
-        """Get health status for all suppliers."""
+        """Get health status for all suppliers (served from cache for ``cache_ttl`` s)."""
+        now = time.monotonic()
+        if self._cached is not None and now - self._cached[0] < self.cache_ttl:
+            CACHE_REQUESTS.labels(cache="ingest_health", result="hit").inc()
+            return self._cached[1]
+        CACHE_REQUESTS.labels(cache="ingest_health", result="miss").inc()
+
+        queries = 0
+
+        def _count_query(_state) -> None:
+            nonlocal queries
+            queries += 1
+
+        started = time.perf_counter()
         async with self.session_factory() as session:
+            event.listen(session.sync_session, "do_orm_execute", _count_query)
             suppliers = await self._get_all_suppliers(session)
-            supplier_stats = []
-
-            for supplier in suppliers:
-                stats = await self._get_supplier_stats(session, supplier)
-                supplier_stats.append(stats)
+            stats_by_supplier = await self._get_supplier_stats(session, suppliers)
+        elapsed = time.perf_counter() - started
+
+        DB_QUERIES.labels(operation="ingest_health").inc(queries)
+        DB_QUERY_SECONDS.labels(operation="ingest_health").observe(elapsed)
+        logger.debug("ingest_health_computed", queries=queries, seconds=round(elapsed, 4))
+
+        report = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "suppliers": [
+                stats_by_supplier.get(supplier) or self._empty_stats(supplier)
+                for supplier in suppliers
+            ],
+        }
+        if self.cache_ttl > 0:
+            self._cached = (now, report)
+        return report
 
-            return {
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-                "suppliers": supplier_stats,
-            }
+    def invalidate(self) -> None:
+        self._cached = None
 
     async def _get_all_suppliers(self, session: AsyncSession) -> list[str]:
         """Get list of all configured suppliers from config files.
 
         Returns suppliers from parsers/config/*.yaml, not just those in DB.
-        This ensures we show all suppliers even if they've never been run.
+        This ensures we show all suppliers even if they've never been run. The list comes
+        from the cached config registry, so health checks do no filesystem work.
         """
-        config_dir = Path("parsers/config")
-
-        if not config_dir.exists():
-            logger.warning("config_directory_not_found", path=str(config_dir))
-            # Fallback to DB if config dir doesn't exist
+        suppliers = get_config_registry().slugs()
+        if not suppliers:
+            logger.warning("no_supplier_configs_found", path=str(get_config_registry().config_dir))
+            # Fallback to DB if no config is available
             result = await session.execute(
                 select(IngestRun.supplier).distinct().order_by(IngestRun.supplier)
             )
             return [row[0] for row in result.all()]
 
-        suppliers = []
-        for config_file in config_dir.glob("*.yaml"):
-            # Use filename (stem) as supplier identifier to avoid duplicates
-            # This matches how the pipeline is invoked: python -m ingest.pipeline <filename>
-            suppliers.append(config_file.stem)
-
-        return sorted(suppliers)
-
-    async def _get_supplier_stats(self, session: AsyncSession, supplier: str) -> dict[str, Any]:
-        """Get stats for a specific supplier."""
-        # Get last run
-        last_run_result = await session.execute(
-            select(IngestRun)
-            .where(IngestRun.supplier == supplier)
-            .order_by(IngestRun.started_at.desc())
-            .limit(1)
-        )
-        last_run = last_run_result.scalar_one_or_none()
-
-        if not last_run:
-            return {
-                "supplier": supplier,
-                "last_run_at": None,
-                "last_run_status": None,
-                "last_success_at": None,
-                "rows_last_inserted": 0,
-                "data_status": "unknown",
-                "consecutive_failures": 0,
-            }
+        # Config file stems are the supplier identifiers, matching how the pipeline is
+        # invoked: python -m ingest.pipeline <filename>
+        return suppliers
 
-        # Get last successful run
-        last_success_result = await session.execute(
-            select(IngestRun)
-            .where(and_(IngestRun.supplier == supplier, IngestRun.status == "success"))
-            .order_by(IngestRun.started_at.desc())
-            .limit(1)
-        )
-        last_success = last_success_result.scalar_one_or_none()
+    async def _get_supplier_stats(
+        self, session: AsyncSession, suppliers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Stats for every supplier with at least one run, in a single statement.
 
-        # Count consecutive failures
-        consecutive_failures = await self._count_consecutive_failures(session, supplier)
-
-        # Determine data_status
-        data_status = self._determine_data_status(last_run, last_success, consecutive_failures)
+        A window pass over ``ingest_runs`` (``idx_ingest_runs_supplier_started``) numbers each
+        supplier's runs newest first and counts the non-failed runs seen so far; the outer
+        aggregate then picks the latest run, the latest success and the leading failures.
+        """
+        if not suppliers:
+            return {}
+        newest_first = (IngestRun.started_at.desc(), IngestRun.id.desc())
+        is_failure = IngestRun.status.in_(FAILURE_STATUSES)
+        runs = (
+            select(
+                IngestRun.supplier,
+                IngestRun.started_at,
+                IngestRun.status,
+                IngestRun.rows_inserted,
+                IngestRun.error_message,
+                func.row_number()
+                .over(partition_by=IngestRun.supplier, order_by=newest_first)
+                .label("rn"),
+                # Non-failed runs from the newest down to this one: 0 inside the failure streak.
+                func.count(case((~is_failure, 1)))
+                .over(partition_by=IngestRun.supplier, order_by=newest_first, rows=(None, 0))
+                .label("ok_seen"),
+            )
+            .where(IngestRun.supplier.in_(suppliers))
+            .subquery()
+        )
+        is_last = runs.c.rn == 1
+        stmt = select(
+            runs.c.supplier,
+            func.max(case((is_last, runs.c.started_at))).label("last_run_at"),
+            func.max(case((is_last, runs.c.status))).label("last_run_status"),
+            func.max(case((is_last, runs.c.rows_inserted))).label("rows_last_inserted"),
+            func.max(case((is_last, runs.c.error_message))).label("last_error_message"),
+            func.max(case((runs.c.status.in_(SUCCESS_STATUSES), runs.c.started_at))).label(
+                "last_success_at"
+            ),
+            func.count(case((runs.c.ok_seen == 0, 1))).label("consecutive_failures"),
+        ).group_by(runs.c.supplier)
+        result = await session.execute(stmt)
+
+        stats: dict[str, dict[str, Any]] = {}
+        for row in result.all():
+            data_status = self._determine_data_status(
+                row.last_run_status, row.last_success_at, row.consecutive_failures
+            )
+            stats[row.supplier] = {
+                "supplier": row.supplier,
+                "last_run_at": row.last_run_at.isoformat(),
+                "last_run_status": row.last_run_status,
+                "last_success_at": (
+                    row.last_success_at.isoformat() if row.last_success_at else None
+                ),
+                "rows_last_inserted": row.rows_last_inserted or 0,
+                "data_status": data_status,
+                "consecutive_failures": row.consecutive_failures,
+                "error_message": (
+                    row.last_error_message if row.last_run_status == "failed" else None
+                ),
+            }
+        return stats
 
+    @staticmethod
+    def _empty_stats(supplier: str) -> dict[str, Any]:
         return {
             "supplier": supplier,
-            "last_run_at": last_run.started_at.isoformat() if last_run else None,
-            "last_run_status": last_run.status if last_run else None,
-            "last_success_at": last_success.started_at.isoformat() if last_success else None,
-            "rows_last_inserted": last_run.rows_inserted if last_run else 0,
-            "data_status": data_status,
-            "consecutive_failures": consecutive_failures,
-            "error_message": (
-                last_run.error_message if last_run and last_run.status == "failed" else None
-            ),
+            "last_run_at": None,
+            "last_run_status": None,
+            "last_success_at": None,
+            "rows_last_inserted": 0,
+            "data_status": "unknown",
+            "consecutive_failures": 0,
         }
 
-    async def _count_consecutive_failures(self, session: AsyncSession, supplier: str) -> int:
-        """Count consecutive failures from the most recent run."""
-        result = await session.execute(
-            select(IngestRun.status)
-            .where(IngestRun.supplier == supplier)
-            .order_by(IngestRun.started_at.desc())
-            .limit(20)
-        )
-        runs = [row[0] for row in result.all()]
-
-        count = 0
-        for status in runs:
-            if status in ("failed", "source_unavailable"):
-                count += 1
-            else:
-                break
-
-        return count
-
     def _determine_data_status(
         self,
-        last_run: IngestRun | None,
-        last_success: IngestRun | None,
+        last_run_status: str | None,
+        last_success_at: datetime | None,
         consecutive_failures: int,
     ) -> str:
         """Determine data status based on run history."""
-        if not last_run:
+        if not last_run_status:
             return "unknown"
 
         now = datetime.now(timezone.utc)
 
         # broken: dernier run failed ou source_unavailable
-        if last_run.status in ("failed", "source_unavailable"):
+        if last_run_status in FAILURE_STATUSES:
             return "broken"
 
         # stale: dernier success > 14 jours
-        if last_success:
+        if last_success_at:
             # Ensure timezone-aware comparison
-            success_time = last_success.started_at
+            success_time = last_success_at
             if success_time.tzinfo is None:
                 success_time = success_time.replace(tzinfo=timezone.utc)
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import csv
+import io
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from api.app.core.cache import VersionedCache
 from api.app.core.config import settings
+from api.app.core.http_cache import Validators, make_etag
 from api.app.db import models
-from api.app.db.repositories.tariffs import TariffRepository
+from api.app.db.repositories.tariffs import HISTORY_PAGE_SIZE, TariffRepository, decode_cursor
 from api.app.db.session import get_session
 from api.app.models.enums import FreshnessStatus, TariffOption
 from api.app.models.tariffs import (
@@ -26,6 +30,22 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+async def load_data_version() -> tuple:
+    async with get_session() as session:
+        return await TariffRepository(session).data_version()
+
+
+# Read results only change when an ingest commits: serve them from memory until the
+# data version moves (or the TTL elapses, since freshness depends on the clock).
+tariff_cache = VersionedCache(
+    "tariffs",
+    version_loader=load_data_version,
+    maxsize=settings.tariff_cache_max_entries,
+    ttl=settings.tariff_cache_ttl_seconds,
+    version_interval=settings.tariff_cache_version_interval_seconds,
+)
+
+
 def _seed_observations() -> list[TariffObservation]:
     """Simulate DB rows then compute data_status according to the constitution."""
     now = datetime.now(timezone.utc)
@@ -139,17 +159,63 @@ def _filter_observations(
     return [obs for obs in observations if is_visible(obs)]
 
 
+async def fetch_validators(*parts: Any) -> Validators | None:
+    """HTTP validators for a tariff read identified by ``parts`` (route + filters).
+
+    Costs at most one data-version query (shared with ``tariff_cache``). ``None`` when the
+    response would come from seed data, which has no stable version.
+    """
+    if not settings.enable_db:
+        return None
+    try:
+        version = await tariff_cache.version()
+    except SQLAlchemyError as exc:
+        logger.warning("DB data version lookup failed, skipping HTTP validators: %s", exc)
+        return None
+    if not version or version[0] is None:
+        return None
+    # data_status is derived from the clock as well as the data: roll the tag every hour
+    # so revalidating clients pick up fresh -> stale transitions.
+    now = datetime.now(timezone.utc)
+    hour = now.strftime("%Y%m%d%H")
+    # Last-Modified must move whenever the ETag does, so If-Modified-Since never matches
+    # a changed body: not max(observed_at), which backfills and "unchanged" runs leave
+    # as is, but the latest of the last ingest run, the last version change seen by this
+    # process and the start of the current hour.
+    last_modified = max(
+        moment
+        for moment in (
+            _as_utc(version[1]),
+            tariff_cache.version_changed_at,
+            now.replace(minute=0, second=0, microsecond=0),
+        )
+        if moment is not None
+    )
+    return Validators(etag=make_etag(version, hour, *parts), last_modified=last_modified)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
 async def fetch_latest_tariffs(
     *, option: TariffOption | None = None, puissance: int | None = None, include_stale: bool = False
 ) -> TariffCollection:
     observations: list[TariffObservation] | None = None
     if settings.enable_db:
-        try:
+
+        async def _load() -> list[TariffObservation]:
             async with get_session() as session:
                 repo = TariffRepository(session)
-                observations = await repo.fetch_latest(
+                return await repo.fetch_latest(
                     option=option, puissance=puissance, include_stale=include_stale
                 )
+
+        key = ("latest", option.value if option else None, puissance or None, include_stale)
+        try:
+            observations = await tariff_cache.get_or_load(key, _load)
         except SQLAlchemyError as exc:
             logger.warning("DB fetch_latest_tariffs failed, falling back to seed data: %s", exc)
             observations = None
@@ -163,19 +229,101 @@ async def fetch_latest_tariffs(
     return TariffCollection(items=observations)
 
 
-async def fetch_history(filters: TariffHistoryFilters) -> TariffHistoryResponse:
+async def fetch_history(
+    filters: TariffHistoryFilters,
+    *,
+    limit: int = HISTORY_PAGE_SIZE,
+    cursor: str | None = None,
+) -> TariffHistoryResponse:
+    """One page of history; raises ``ValueError`` for a malformed ``cursor``."""
+    if cursor:
+        decode_cursor(cursor)
     observations: list[TariffObservation] | None = None
+    next_cursor: str | None = None
     if settings.enable_db:
-        try:
+        query = filters.model_dump(exclude_none=True)
+
+        async def _load() -> tuple[list[TariffObservation], str | None]:
             async with get_session() as session:
-                repo = TariffRepository(session)
-                observations = await repo.fetch_history(filters.model_dump(exclude_none=True))
+                return await TariffRepository(session).fetch_history(
+                    query, limit=limit, cursor=cursor
+                )
+
+        key = (
+            "history",
+            *sorted(filters.model_dump(exclude_none=True, mode="json").items()),
+            limit,
+            cursor,
+        )
+        try:
+            observations, next_cursor = await tariff_cache.get_or_load(key, _load)
         except SQLAlchemyError as exc:
             logger.warning("DB fetch_history failed, falling back to seed data: %s", exc)
             observations = None
     if observations is None:
         observations = [obs for obs in _seed_observations() if _matches_filters(obs, filters)]
-    return TariffHistoryResponse(filters=filters, items=observations)
+    return TariffHistoryResponse(filters=filters, items=observations, next_cursor=next_cursor)
+
+
+HISTORY_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+_CSV_COLUMNS = list(TariffObservation.model_fields)
+# Rows per response chunk: small enough to start sending at once, large enough to
+# avoid one write per row.
+_STREAM_CHUNK_ROWS = 100
+
+
+def stream_history(
+    filters: TariffHistoryFilters, *, output_format: str, cursor: str | None = None
+) -> AsyncIterator[str]:
+    """Full history export as NDJSON or CSV text chunks, read through a server-side cursor.
+
+    The cursor is checked here, before the response starts; the rows themselves are
+    only fetched while the returned iterator is consumed.
+    """
+    if output_format not in HISTORY_EXPORT_MEDIA_TYPES:
+        raise ValueError(f"Unsupported history export format: {output_format}")
+    if cursor:
+        decode_cursor(cursor)
+    return _stream_history(filters, output_format=output_format, cursor=cursor)
+
+
+async def _stream_history(
+    filters: TariffHistoryFilters, *, output_format: str, cursor: str | None
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_CSV_COLUMNS)
+
+    def _drain() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    def _encode(obs: TariffObservation) -> str:
+        if output_format == "ndjson":
+            return obs.model_dump_json() + "\n"
+        writer.writerow(obs.model_dump(mode="json"))
+        return _drain()
+
+    if output_format == "csv":
+        writer.writeheader()
+        yield _drain()
+    if not settings.enable_db:
+        for obs in _seed_observations():
+            if _matches_filters(obs, filters):
+                yield _encode(obs)
+        return
+
+    chunk: list[str] = []
+    async with get_session() as session:
+        repo = TariffRepository(session)
+        async for obs in repo.stream_history(filters.model_dump(exclude_none=True), cursor=cursor):
+            chunk.append(_encode(obs))
+            if len(chunk) >= _STREAM_CHUNK_ROWS:
+                yield "".join(chunk)
+                chunk.clear()
+    if chunk:
+        yield "".join(chunk)
 
 
 def _matches_filters(obs: TariffObservation, filters: TariffHistoryFilters) -> bool:
@@ -219,11 +367,14 @@ async def compute_trve_diff() -> TrveDiffResponse:
     now = datetime.now(timezone.utc)
     if not settings.enable_db:
         return compute_trve_diff_seed()
-    try:
+
+    async def _load() -> tuple[list[TariffObservation], list[models.TrveReference]]:
         async with get_session() as session:
             repo = TariffRepository(session)
-            observations = await repo.fetch_latest(include_stale=True)
-            trve_rows = await repo.fetch_trve_reference()
+            return await repo.fetch_latest(include_stale=True), await repo.fetch_trve_reference()
+
+    try:
+        observations, trve_rows = await tariff_cache.get_or_load(("trve_diff",), _load)
     except SQLAlchemyError as exc:
         logger.warning("DB compute_trve_diff failed, returning seed data: %s", exc)
         return compute_trve_diff_seed()
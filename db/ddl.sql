@@ -24,8 +24,14 @@ create table if not exists tariffs (
 create unique index if not exists uq_tariffs_obs
   on tariffs(supplier_id, option, puissance_kva, observed_at, parser_version, source_checksum);
 
-create index if not exists idx_tariffs_latest
-  on tariffs(supplier_id, option, puissance_kva, observed_at desc);
+-- one series per offer (a supplier can publish several offers, one per source_url)
+drop index if exists idx_tariffs_latest;
+create index if not exists idx_tariffs_latest_offer
+  on tariffs(supplier_id, source_url, option, puissance_kva, observed_at desc);
+
+-- keyset pagination of /v1/tariffs/history
+create index if not exists idx_tariffs_history
+  on tariffs(observed_at desc, id desc);
 
 -- TRVE reference table
 create table if not exists trve_reference (
@@ -54,7 +60,7 @@ create table if not exists ingest_runs (
   supplier varchar(50) not null,
   started_at timestamptz not null default now(),
   finished_at timestamptz,
-  status varchar(20) not null check (status in ('running', 'success', 'failed', 'source_unavailable')),
+  status varchar(20) not null,
   rows_inserted integer default 0,
   error_message text,
   source_url varchar(500),
@@ -64,11 +70,17 @@ create table if not exists ingest_runs (
 
 create index if not exists idx_ingest_runs_supplier_started on ingest_runs(supplier, started_at desc);
 
+-- 'unchanged': source answered 304 / identical validators, nothing parsed or persisted
+alter table ingest_runs drop constraint if exists ingest_runs_status_check;
+alter table ingest_runs add constraint ingest_runs_status_check
+  check (status in ('running', 'success', 'failed', 'source_unavailable', 'unchanged'));
+
 -- latest view
 create or replace view latest_tariffs as
 select t.* from (
   select *,
-         row_number() over (partition by supplier_id, option, puissance_kva order by observed_at desc) as rn
+         row_number() over (partition by supplier_id, source_url, option, puissance_kva
+                            order by observed_at desc, id desc) as rn
   from tariffs
 ) t where rn = 1;
 
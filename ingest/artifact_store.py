@@ -0,0 +1,204 @@
+"""Content-addressed store for raw supplier artifacts.
+
+Blobs are keyed by the SHA-256 the fetcher already computes and sharded as
+``<root>/objects/<sha[0:2]>/<sha[2:4]>/<sha>``, so identical downloads are stored once
+and a checksum lookup is a single path computation. A small append-only
+``index.jsonl`` maps each fetch (supplier, source_url, fetched_at) to its checksum.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from api.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_STORE_ROOT = Path("artifacts/raw")
+
+
+class ArtifactTooLargeError(ValueError):
+    """Raised when a download exceeds the configured maximum artifact size."""
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    supplier: str
+    source_url: str
+    fetched_at: str
+    checksum: str
+
+
+@dataclass
+class GcReport:
+    kept: int = 0
+    removed: list[str] = field(default_factory=list)
+    freed_bytes: int = 0
+
+
+class ArtifactStore:
+    """Deduplicating blob store with a (supplier, fetched_at) -> checksum index."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or DEFAULT_STORE_ROOT
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.jsonl"
+        self._index: dict[tuple[str, str], IndexEntry] | None = None
+
+    def blob_path(self, checksum: str) -> Path:
+        return self.objects_dir / checksum[:2] / checksum[2:4] / checksum
+
+    def find(self, checksum: str) -> Path | None:
+        path = self.blob_path(checksum)
+        return path if path.exists() else None
+
+    def put_bytes(
+        self,
+        data: bytes,
+        *,
+        supplier: str,
+        source_url: str,
+        fetched_at: datetime | None = None,
+    ) -> tuple[Path, str]:
+        """Store ``data`` once and index this fetch; returns (blob path, checksum)."""
+        return self.put_stream(
+            [data], supplier=supplier, source_url=source_url, fetched_at=fetched_at
+        )
+
+    def put_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        supplier: str,
+        source_url: str,
+        fetched_at: datetime | None = None,
+        max_bytes: int | None = None,
+    ) -> tuple[Path, str]:
+        """Stream ``chunks`` to a temp file while hashing, then rename it into place.
+
+        Memory stays bounded by the chunk size. Raises ``ArtifactTooLargeError`` as soon as
+        more than ``max_bytes`` have been received; the partial file is discarded.
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        digest = sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self.objects_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ArtifactTooLargeError(
+                            f"Artifact from {source_url} exceeds {max_bytes} bytes"
+                        )
+                    digest.update(chunk)
+                    handle.write(chunk)
+            checksum = digest.hexdigest()
+            path = self.blob_path(checksum)
+            if path.exists():
+                logger.debug("artifact_deduplicated", checksum=checksum)
+                os.unlink(tmp_name)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.record(
+            supplier=supplier, source_url=source_url, checksum=checksum, fetched_at=fetched_at
+        )
+        return path, checksum
+
+    def record(
+        self,
+        *,
+        supplier: str,
+        source_url: str,
+        checksum: str,
+        fetched_at: datetime | None = None,
+    ) -> IndexEntry:
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        entry = IndexEntry(
+            supplier=supplier,
+            source_url=source_url,
+            fetched_at=fetched_at.isoformat(),
+            checksum=checksum,
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.index_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(asdict(entry)) + "\n")
+        if self._index is not None:
+            self._index[(entry.supplier, entry.fetched_at)] = entry
+        return entry
+
+    def entries(self) -> Iterator[IndexEntry]:
+        if not self.index_path.exists():
+            return
+        with self.index_path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield IndexEntry(**json.loads(line))
+
+    def lookup(self, supplier: str, fetched_at: datetime) -> str | None:
+        """Checksum of the artifact fetched for ``supplier`` at ``fetched_at``."""
+        if self._index is None:
+            self._index = {(entry.supplier, entry.fetched_at): entry for entry in self.entries()}
+        entry = self._index.get((supplier, fetched_at.isoformat()))
+        return entry.checksum if entry else None
+
+    def latest_checksums(self) -> set[str]:
+        """Checksum of the most recent fetch of every (supplier, source_url)."""
+        latest: dict[tuple[str, str], IndexEntry] = {}
+        for entry in self.entries():
+            key = (entry.supplier, entry.source_url)
+            if key not in latest or entry.fetched_at >= latest[key].fetched_at:
+                latest[key] = entry
+        return {entry.checksum for entry in latest.values()}
+
+    def gc(
+        self, keep: Iterable[str], *, keep_latest: bool = True, dry_run: bool = False
+    ) -> GcReport:
+        """Delete blobs whose checksum is not in ``keep`` and prune their index entries.
+
+        With ``keep_latest`` the newest blob of each source survives even when nothing
+        references it yet (e.g. a fetch that was not persisted).
+        """
+        keep_set = {checksum.strip() for checksum in keep}
+        if keep_latest:
+            keep_set |= self.latest_checksums()
+
+        report = GcReport()
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*/*"):
+                if path.name in keep_set:
+                    report.kept += 1
+                    continue
+                report.removed.append(path.name)
+                report.freed_bytes += path.stat().st_size
+                if not dry_run:
+                    path.unlink()
+
+        if not dry_run and report.removed:
+            removed = set(report.removed)
+            remaining = [entry for entry in self.entries() if entry.checksum not in removed]
+            tmp_index = self.index_path.with_suffix(".jsonl.tmp")
+            tmp_index.write_text(
+                "".join(json.dumps(asdict(entry)) + "\n" for entry in remaining), encoding="utf-8"
+            )
+            os.replace(tmp_index, self.index_path)
+            self._index = None
+        logger.info(
+            "artifact_gc_completed",
+            kept=report.kept,
+            removed=len(report.removed),
+            freed_bytes=report.freed_bytes,
+            dry_run=dry_run,
+        )
+        return report
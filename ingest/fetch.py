@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import json
+from dataclasses import asdict, dataclass, field
 from hashlib import sha256
 from pathlib import Path
+from typing import Any, Literal, Mapping
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
 
 from parsers.core.config import SupplierConfig
 from api.app.core.logging import get_logger
+from ingest.artifact_store import ArtifactStore, ArtifactTooLargeError
 
 logger = get_logger(__name__)
 
 
 DEFAULT_RAW_DIR = Path("artifacts/raw")
 DEFAULT_TIMEOUT = 60
+DEFAULT_MAX_BYTES = 25 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
 DEFAULT_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -25,14 +30,15 @@ DEFAULT_HEADERS = {
 }
 
 
-def _http_session() -> requests.Session:
+def build_http_session(pool_maxsize: int = 10) -> requests.Session:
+    """Create a retrying HTTP session; reuse it to share one connection pool."""
     retry = Retry(
         total=3,
         backoff_factor=1.0,
         status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=["GET"],
+        allowed_methods=["GET", "HEAD"],
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
     session = requests.Session()
     session.headers.update(DEFAULT_HEADERS)
     session.mount("http://", adapter)
@@ -40,27 +46,149 @@ def _http_session() -> requests.Session:
     return session
 
 
+@dataclass
+class SourceValidators:
+    """HTTP validators (and resulting artifact) recorded for one supplier source."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_length: int | None = None
+    checksum: str | None = None
+    path: str | None = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str], **extra: Any) -> "SourceValidators":
+        length = headers.get("Content-Length")
+        return cls(
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_length=int(length) if length and length.isdigit() else None,
+            **extra,
+        )
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FetchMetadataStore:
+    """Sidecar JSON files keeping the validators of the last processed download per source.
+
+    Callers save validators only once the artifact has been fully processed, so a failed
+    parse or persist is retried on the next run instead of being reported as unchanged.
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = root or DEFAULT_RAW_DIR / "fetch_meta"
+
+    def _path(self, config: SupplierConfig) -> Path:
+        url_hash = sha256(str(config.source.url).encode("utf-8")).hexdigest()[:12]
+        return self.root / f"{config.supplier.lower()}_{url_hash}.json"
+
+    def load(self, config: SupplierConfig) -> SourceValidators | None:
+        path = self._path(config)
+        if not path.exists():
+            return None
+        try:
+            return SourceValidators(**json.loads(path.read_text(encoding="utf-8")))
+        except (TypeError, ValueError):
+            logger.warning("fetch_metadata_invalid", path=str(path))
+            return None
+
+    def save(self, config: SupplierConfig, validators: SourceValidators) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._path(config).write_text(json.dumps(asdict(validators), indent=2), encoding="utf-8")
+
+    def clear(self, config: SupplierConfig) -> None:
+        self._path(config).unlink(missing_ok=True)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a fetch: a freshly stored artifact or an unchanged source."""
+
+    status: Literal["fetched", "unchanged"]
+    path: Path | None
+    checksum: str | None
+    validators: SourceValidators = field(default_factory=SourceValidators)
+
+    @property
+    def unchanged(self) -> bool:
+        return self.status == "unchanged"
+
+
 def fetch_supplier_artifact(
-    config: SupplierConfig, raw_dir: Path | None = None, timeout: int = DEFAULT_TIMEOUT
-) -> tuple[Path, str]:
-    """Download the supplier source (HTML/PDF) and store it locally."""
+    config: SupplierConfig,
+    raw_dir: Path | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    *,
+    session: requests.Session | None = None,
+    metadata_store: FetchMetadataStore | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> FetchResult:
+    """Download the supplier source (HTML/PDF) into the content-addressed ``raw_dir`` store.
+
+    Pass ``session`` to reuse a connection pool across suppliers (see ``ingest.orchestrator``).
+    With a ``metadata_store``, the request is conditional (If-None-Match/If-Modified-Since)
+    and a 304 returns an ``unchanged`` result without downloading the body. Sources that
+    never sent ETag/Last-Modified are always downloaded: a matching Content-Length alone
+    is no proof the grid is unchanged, so the caller compares checksums instead.
+
+    The body is streamed in chunks, hashed incrementally and renamed atomically into the
+    store; responses larger than ``max_bytes`` are aborted with ``ArtifactTooLargeError``.
+    """
     raw_dir = raw_dir or DEFAULT_RAW_DIR
     raw_dir.mkdir(parents=True, exist_ok=True)
 
-    session = _http_session()
-    logger.info("fetch_started", url=str(config.source.url))
+    session = session or build_http_session()
+    url = str(config.source.url)
+    stored = metadata_store.load(config) if metadata_store else None
+    logger.info("fetch_started", url=url, conditional=bool(stored and stored.has_validators))
     try:
-        response = session.get(str(config.source.url), timeout=timeout)
-        response.raise_for_status()
+        headers = stored.conditional_headers() if stored else {}
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304 and stored:
+                logger.info("fetch_unchanged", url=url, method="GET")
+                return _unchanged_result(stored)
+            response.raise_for_status()
+            validators = SourceValidators.from_headers(response.headers)
+            if validators.content_length is not None and validators.content_length > max_bytes:
+                raise ArtifactTooLargeError(
+                    f"Artifact from {url} announces {validators.content_length} bytes "
+                    f"(limit {max_bytes})"
+                )
+            file_path, checksum = ArtifactStore(raw_dir).put_stream(
+                response.iter_content(chunk_size=CHUNK_SIZE),
+                supplier=config.supplier.lower(),
+                source_url=url,
+                max_bytes=max_bytes,
+            )
     except requests.RequestException as e:
-        logger.error("fetch_failed", url=str(config.source.url), error=str(e))
+        logger.error("fetch_failed", url=url, error=str(e))
+        raise
+    except ArtifactTooLargeError as e:
+        logger.error("fetch_too_large", url=url, max_bytes=max_bytes, error=str(e))
         raise
 
-    content = response.content
-    checksum = sha256(content).hexdigest()
+    validators.checksum = checksum
+    validators.path = str(file_path)
+    if validators.content_length is None:
+        validators.content_length = file_path.stat().st_size
+    return FetchResult(status="fetched", path=file_path, checksum=checksum, validators=validators)
 
-    suffix = ".html" if config.source.format == "html" else ".pdf"
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    file_path = raw_dir / f"{config.supplier.lower()}_{timestamp}{suffix}"
-    file_path.write_bytes(content)
-    return file_path, checksum
+
+def _unchanged_result(stored: SourceValidators) -> FetchResult:
+    return FetchResult(
+        status="unchanged",
+        path=Path(stored.path) if stored.path else None,
+        checksum=stored.checksum,
+        validators=stored,
+    )
@@ -0,0 +1,229 @@
+"""In-process ingest orchestrator running every supplier in a single event loop.
+
+Replaces the subprocess-per-supplier loop: all suppliers share one HTTP connection
+pool and one DB engine, and each stage (fetch, parse, persist) is capped by its own
+semaphore so slow downloads never starve parsing or persistence.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+import requests
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.app.core.logging import get_logger
+from ingest.fetch import (
+    DEFAULT_MAX_BYTES,
+    FetchMetadataStore,
+    build_http_session,
+    fetch_supplier_artifact,
+)
+from ingest.parse_pool import DEFAULT_PARSE_TIMEOUT, ParseJob, ParsePool
+from ingest.persist import TariffPersister
+from ingest.rate_limiter import AsyncRateLimiter
+from ingest.pipeline import IngestRunLogger, skip_unchanged_artifact, write_payload
+from parsers.core.config import load_supplier_config
+
+logger = get_logger(__name__)
+
+DEFAULT_FETCH_CONCURRENCY = 4
+DEFAULT_PARSE_CONCURRENCY = 2
+DEFAULT_PERSIST_CONCURRENCY = 2
+
+
+@dataclass
+class SupplierOutcome:
+    """Result and per-stage timings of one supplier run."""
+
+    supplier: str
+    status: str = "pending"
+    rows_parsed: int = 0
+    rows_inserted: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    persist_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.fetch_seconds + self.parse_seconds + self.persist_seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("success", "unchanged")
+
+
+class IngestOrchestrator:
+    """Fetch, parse and persist several suppliers concurrently in one process."""
+
+    def __init__(
+        self,
+        *,
+        persist: bool = True,
+        raw_dir: Path | None = None,
+        parsed_dir: Path | None = None,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        parse_concurrency: int = DEFAULT_PARSE_CONCURRENCY,
+        persist_concurrency: int = DEFAULT_PERSIST_CONCURRENCY,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        http_session: requests.Session | None = None,
+        metadata_store: FetchMetadataStore | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        rate_limiter: AsyncRateLimiter | None = None,
+        parse_timeout: float = DEFAULT_PARSE_TIMEOUT,
+        force: bool = False,
+    ):
+        self.persist = persist
+        self.force = force
+        self.raw_dir = raw_dir
+        self.parsed_dir = parsed_dir
+        self.max_bytes = max_bytes
+        self.rate_limiter = rate_limiter or AsyncRateLimiter()
+        self.http_session = http_session or build_http_session(pool_maxsize=fetch_concurrency)
+        self.metadata_store = metadata_store or FetchMetadataStore(
+            raw_dir / "fetch_meta" if raw_dir else None
+        )
+        self._fetch_slots = asyncio.Semaphore(fetch_concurrency)
+        self.parse_concurrency = parse_concurrency
+        self.parse_timeout = parse_timeout
+        self._parse_slots = asyncio.Semaphore(parse_concurrency)
+        self._parse_pool: ParsePool | None = None
+        self._persist_slots = asyncio.Semaphore(persist_concurrency)
+        self.run_logger: IngestRunLogger | None = None
+        self.persister: TariffPersister | None = None
+        if persist:
+            self.run_logger = IngestRunLogger(session_factory)
+            self.persister = TariffPersister(session_factory)
+
+    async def run(
+        self, suppliers: Sequence[str], *, observed_at: datetime
+    ) -> list[SupplierOutcome]:
+        """Run every supplier concurrently; outcomes keep the input order."""
+        logger.info("orchestrator_started", suppliers=list(suppliers))
+        # Parsing is CPU-bound: run it on worker processes, one per parse slot.
+        with ParsePool(max_workers=self.parse_concurrency, timeout=self.parse_timeout) as pool:
+            self._parse_pool = pool
+            try:
+                outcomes = await asyncio.gather(
+                    *(self._run_supplier(supplier, observed_at) for supplier in suppliers)
+                )
+            finally:
+                self._parse_pool = None
+        logger.info(
+            "orchestrator_completed",
+            succeeded=sum(1 for outcome in outcomes if outcome.ok),
+            failed=sum(1 for outcome in outcomes if not outcome.ok),
+        )
+        return list(outcomes)
+
+    async def _run_supplier(self, supplier: str, observed_at: datetime) -> SupplierOutcome:
+        outcome = SupplierOutcome(supplier=supplier)
+        run_id: int | None = None
+        checksum: str | None = None
+        try:
+            config = load_supplier_config(supplier)
+            if self.run_logger:
+                run_id = await self.run_logger.start_run(
+                    supplier=config.supplier, source_url=str(config.source.url)
+                )
+
+            # Wait for the domain's rate limit before taking a fetch slot so a throttled
+            # domain never blocks downloads from other suppliers.
+            self.rate_limiter.configure_source(config)
+            waited = await self.rate_limiter.acquire(str(config.source.url))
+            if waited:
+                logger.info("fetch_rate_limited", supplier=supplier, waited_seconds=waited)
+
+            async with self._fetch_slots:
+                started = time.perf_counter()
+                fetch_result = await asyncio.to_thread(
+                    fetch_supplier_artifact,
+                    config,
+                    raw_dir=self.raw_dir,
+                    session=self.http_session,
+                    metadata_store=None if self.force else self.metadata_store,
+                    max_bytes=self.max_bytes,
+                )
+                outcome.fetch_seconds = time.perf_counter() - started
+            checksum = fetch_result.checksum
+            if await skip_unchanged_artifact(
+                self.run_logger,
+                run_id,
+                config,
+                fetch_result,
+                self.metadata_store,
+                force=self.force,
+            ):
+                outcome.status = "unchanged"
+                return outcome
+            artifact_path = fetch_result.path
+
+            async with self._parse_slots:
+                started = time.perf_counter()
+                batch = await self._parse_pool.parse(
+                    ParseJob(
+                        config=config,
+                        artifact_path=artifact_path,
+                        observed_at=observed_at,
+                        source_checksum=checksum,
+                    )
+                )
+                write_payload(
+                    batch, supplier=supplier, observed_at=observed_at, parsed_dir=self.parsed_dir
+                )
+                outcome.parse_seconds = time.perf_counter() - started
+            outcome.rows_parsed = len(batch)
+
+            if self.persister:
+                async with self._persist_slots:
+                    started = time.perf_counter()
+                    outcome.rows_inserted = await self.persister.persist(config, batch)
+                    outcome.persist_seconds = time.perf_counter() - started
+
+            outcome.status = "success"
+            if run_id and self.run_logger:
+                await self.run_logger.complete_run(
+                    run_id,
+                    status="success",
+                    rows_inserted=outcome.rows_inserted,
+                    source_checksum=checksum,
+                )
+                # Only once the rows are committed: a dry run must not turn the next
+                # persisted run into a 304 that never reaches the database.
+                self.metadata_store.save(config, fetch_result.validators)
+        except Exception as exc:
+            logger.exception("supplier_ingest_failed", supplier=supplier, error=str(exc))
+            outcome.status = "failed"
+            outcome.error = str(exc)
+            if run_id and self.run_logger:
+                await self.run_logger.complete_run(
+                    run_id, status="failed", error_message=str(exc), source_checksum=checksum
+                )
+        return outcome
+
+
+def format_summary(outcomes: Sequence[SupplierOutcome], wall_seconds: float | None = None) -> str:
+    """Render a per-supplier timing table for the end of a batch run."""
+    header = (
+        f"{'supplier':<24} {'status':<10} {'rows':>5} {'inserted':>8} "
+        f"{'fetch':>7} {'parse':>7} {'persist':>7} {'total':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for outcome in outcomes:
+        lines.append(
+            f"{outcome.supplier:<24} {outcome.status:<10} {outcome.rows_parsed:>5} "
+            f"{outcome.rows_inserted:>8} {outcome.fetch_seconds:>6.2f}s "
+            f"{outcome.parse_seconds:>6.2f}s {outcome.persist_seconds:>6.2f}s "
+            f"{outcome.total_seconds:>6.2f}s"
+        )
+        if outcome.error:
+            lines.append(f"  error: {outcome.error}")
+    if wall_seconds is not None:
+        lines.append(f"Wall time: {wall_seconds:.2f}s")
+    return "\n".join(lines)
@@ -0,0 +1,213 @@
+"""Process-pool parse stage for batch ingest.
+
+pdfplumber table extraction is pure Python and CPU-bound, so threads only ever use one
+core. ``ParsePool`` ships (config, artifact path, observed_at, checksum) jobs to worker
+processes, at most ``max_workers`` at a time; results come back in submission order.
+
+Each job gets its own process, started once a worker slot is free. The timeout counts
+from that start, and a job past it has its process terminated, so one pathological PDF
+neither keeps a slot busy nor makes the jobs queued behind it time out.
+
+Workers are started from a ``forkserver`` (``spawn`` where unavailable), never forked
+from the caller: the orchestrator starts jobs from helper threads while fetch threads
+may hold requests/urllib3 or logging locks, and a plain ``fork`` would copy those locks
+held forever into the child.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Callable, Iterable
+
+from api.app.core.logging import get_logger
+from parsers.core import parser as yaml_parser
+from parsers.core.batch import TariffBatch
+from parsers.core.config import SupplierConfig
+
+logger = get_logger(__name__)
+
+DEFAULT_PARSE_TIMEOUT = 120.0
+
+
+@dataclass(frozen=True)
+class ParseJob:
+    config: SupplierConfig
+    artifact_path: Path
+    observed_at: datetime
+    source_checksum: str
+
+
+@dataclass
+class ParseResult:
+    job: ParseJob
+    batch: TariffBatch | None = None
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+ParseFunction = Callable[..., TariffBatch]
+
+
+def _execute(job: ParseJob, parse_fn: ParseFunction) -> tuple[TariffBatch, float]:
+    """Worker entrypoint (module level so it can be pickled).
+
+    Returns a columnar batch, which also keeps the result pickled back to the parent small.
+    """
+    started = time.perf_counter()
+    batch = parse_fn(
+        job.config,
+        job.artifact_path,
+        observed_at=job.observed_at,
+        source_checksum=job.source_checksum,
+    )
+    return batch, time.perf_counter() - started
+
+
+def _worker(job: ParseJob, parse_fn: ParseFunction, conn: Connection) -> None:
+    """Child process body: send ``(result, None)`` or ``(None, exception)`` to the parent."""
+    try:
+        conn.send((_execute(job, parse_fn), None))
+    except Exception as exc:
+        try:
+            conn.send((None, exc))
+        except Exception:  # unpicklable exception
+            conn.send((None, RuntimeError(str(exc))))
+    finally:
+        conn.close()
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Import the parser stack once in the server; each worker forked from it skips that.
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+class ParsePool:
+    """Run parse jobs on worker processes, one process per job.
+
+    Example:
+        >>> with ParsePool(max_workers=4, timeout=60) as pool:
+        >>>     results = pool.map(jobs)  # same order as ``jobs``
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        parse_fn: ParseFunction | None = None,
+    ):
+        """Initialize pool.
+
+        Args:
+            max_workers: Concurrent worker processes (default: number of CPUs)
+            timeout: Seconds allowed per job from its process start
+                (default: DEFAULT_PARSE_TIMEOUT, 0 to disable)
+            parse_fn: Module-level function with the ``parse_file_batch`` signature; it is
+                pickled by reference, so the worker process must be able to import it
+                (default: ``parsers.core.parser.parse_file_batch``)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = DEFAULT_PARSE_TIMEOUT if timeout is None else timeout
+        # Each slot thread blocks on its job's process until it ends or is terminated.
+        self._slots = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="parse-slot"
+        )
+        self.parse_fn = parse_fn or yaml_parser.parse_file_batch
+        self._context = _worker_context()
+        self._processes: set[BaseProcess] = set()
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def map(self, jobs: Iterable[ParseJob]) -> list[ParseResult]:
+        """Parse every job concurrently and return results in submission order."""
+        submitted = [(job, self._slots.submit(self._run, job)) for job in jobs]
+        results: list[ParseResult] = []
+        for job, future in submitted:
+            try:
+                batch, seconds = future.result()
+                results.append(ParseResult(job=job, batch=batch, seconds=seconds))
+            except Exception as exc:
+                results.append(ParseResult(job=job, error=str(exc)))
+        return results
+
+    async def parse(self, job: ParseJob) -> TariffBatch:
+        """Parse one job from asyncio code; raises ``TimeoutError`` past the timeout.
+
+        Returns only once the job's process has ended, so a caller's concurrency slot is
+        never released while the process is still parsing.
+        """
+        loop = asyncio.get_running_loop()
+        batch, _ = await loop.run_in_executor(self._slots, self._run, job)
+        return batch
+
+    def _run(self, job: ParseJob) -> tuple[TariffBatch, float]:
+        """Run ``job`` in a fresh process and wait for it, terminating it past the timeout."""
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker, args=(job, self.parse_fn, sender), daemon=True
+        )
+        self._processes.add(process)
+        try:
+            process.start()
+            sender.close()
+            if not receiver.poll(self.timeout or None):
+                raise TimeoutError(self._timeout_message(job))
+            try:
+                result, error = receiver.recv()
+            except EOFError:
+                process.join()
+                raise RuntimeError(
+                    f"Parse worker for {job.artifact_path} exited with code {process.exitcode}"
+                ) from None
+            if error is not None:
+                raise error
+            return result
+        finally:
+            receiver.close()
+            self._stop(process)
+
+    def _stop(self, process: BaseProcess) -> None:
+        if process.is_alive():
+            process.terminate()
+            process.join(5)
+            if process.is_alive():
+                process.kill()
+        process.join()
+        self._processes.discard(process)
+
+    def _timeout_message(self, job: ParseJob) -> str:
+        logger.error(
+            "parse_timed_out",
+            supplier=job.config.supplier,
+            path=str(job.artifact_path),
+            timeout=self.timeout,
+        )
+        return f"Parsing {job.artifact_path} timed out after {self.timeout}s"
+
+    def shutdown(self) -> None:
+        # Jobs still running here were abandoned by their caller (error or cancellation):
+        # stop their processes rather than waiting up to the timeout for each of them.
+        for process in list(self._processes):
+            if process.is_alive():
+                process.terminate()
+        self._slots.shutdown(wait=True, cancel_futures=True)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from functools import partial
+from itertools import islice
+from typing import Any, Iterable, Iterator, get_args
 
 from pydantic import BaseModel, HttpUrl, constr
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from api.app.db.models import Supplier, Tariff
 from api.app.db.session import get_session_factory
 from api.app.models.enums import Puissance, TariffOption
 from api.app.core.logging import get_logger
+from parsers.core.batch import TariffBatch
 from parsers.core.config import SupplierConfig
 
 logger = get_logger(__name__)
@@ -30,47 +34,172 @@ class IngestRow(BaseModel):
     source_checksum: constr(min_length=64, max_length=64)
 
 
+class IngestBatchMetadata(BaseModel):
+    """The ``IngestRow`` fields a ``TariffBatch`` holds once for all of its rows."""
+
+    supplier: str
+    observed_at: datetime
+    parser_version: str
+    source_url: HttpUrl
+    source_checksum: constr(min_length=64, max_length=64)
+
+
+_VALID_OPTIONS = {option.value for option in TariffOption}
+_VALID_PUISSANCES = set(get_args(Puissance))
+
+
+def validate_batch(batch: TariffBatch) -> IngestBatchMetadata:
+    """Validate a batch with the same rules as ``IngestRow``, column by column.
+
+    Metadata goes through pydantic once; per-row values are checked with plain set and
+    type tests. Raises ``ValueError`` naming the first offending row.
+    """
+    metadata = IngestBatchMetadata(**batch.metadata())
+    for index, (option, puissance, abo) in enumerate(
+        zip(batch.option, batch.puissance_kva, batch.abo_month_ttc)
+    ):
+        if option not in _VALID_OPTIONS:
+            raise ValueError(f"Row {index}: invalid option {option!r}")
+        if puissance not in _VALID_PUISSANCES:
+            raise ValueError(f"Row {index}: invalid puissance_kva {puissance!r}")
+        if not isinstance(abo, (int, float)):
+            raise ValueError(f"Row {index}: abo_month_ttc must be a number, got {abo!r}")
+    for name in ("price_kwh_ttc", "price_kwh_hp_ttc", "price_kwh_hc_ttc"):
+        for index, value in enumerate(getattr(batch, name)):
+            if value is not None and not isinstance(value, (int, float)):
+                raise ValueError(f"Row {index}: {name} must be a number, got {value!r}")
+    return metadata
+
+
+# Columns of the uq_tariffs_obs unique index (db/ddl.sql), used as ON CONFLICT target.
+UQ_TARIFFS_OBS_COLUMNS = (
+    "supplier_id",
+    "option",
+    "puissance_kva",
+    "observed_at",
+    "parser_version",
+    "source_checksum",
+)
+# Keeps each multi-row INSERT well under the 32767 bind-parameter limit of asyncpg.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
 class TariffPersister:
-    """Insert parsed rows into the insert-only database."""
+    """Insert parsed rows into the insert-only database.
+
+    Rows are validated as one batch, then written with multi-row
+    ``INSERT ... ON CONFLICT DO NOTHING RETURNING id`` statements against
+    ``uq_tariffs_obs``: re-ingesting the same observations stays a no-op and costs a
+    handful of round-trips instead of two per row. A ``TariffBatch`` is validated column
+    by column and its insert parameters are generated one chunk at a time.
+    """
 
     def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
         self.session_factory = session_factory or get_session_factory()
 
-    async def persist(self, config: SupplierConfig, rows: list[dict[str, Any]]) -> int:
+    async def persist(
+        self, config: SupplierConfig, rows: list[dict[str, Any]] | TariffBatch
+    ) -> int:
         if not rows:
             return 0
+        if isinstance(rows, TariffBatch):
+            metadata = validate_batch(rows)
+            params_for = partial(self._batch_params, rows, metadata)
+        else:
+            records = [IngestRow(**row) for row in rows]
+            params_for = partial(self._rows_params, records)
         async with self.session_factory() as session:
             supplier_id = await self._ensure_supplier(session, config)
-            inserted = 0
-            for row in rows:
-                data = IngestRow(**row)
-                if await self._row_exists(session, supplier_id, data):
-                    logger.debug(
-                        "row_skipped_exists",
-                        supplier=config.supplier,
-                        option=data.option,
-                        puissance=data.puissance_kva,
-                    )
-                    continue
-                session.add(
-                    Tariff(
-                        supplier_id=supplier_id,
-                        option=data.option,
-                        puissance_kva=data.puissance_kva,
-                        price_kwh_ttc=data.price_kwh_ttc,
-                        price_kwh_hp_ttc=data.price_kwh_hp_ttc,
-                        price_kwh_hc_ttc=data.price_kwh_hc_ttc,
-                        abo_month_ttc=data.abo_month_ttc,
-                        observed_at=data.observed_at,
-                        parser_version=data.parser_version,
-                        source_url=str(data.source_url),
-                        source_checksum=data.source_checksum,
+            params = params_for(supplier_id)
+            insert = _DIALECT_INSERTS.get(session.bind.dialect.name)
+            if insert is None:
+                inserted = await self._insert_row_by_row(session, params)
+            else:
+                inserted = 0
+                while chunk := list(islice(params, BULK_INSERT_CHUNK_SIZE)):
+                    stmt = (
+                        insert(Tariff)
+                        .values(chunk)
+                        .on_conflict_do_nothing(index_elements=list(UQ_TARIFFS_OBS_COLUMNS))
+                        .returning(Tariff.id)
                     )
-                )
-                inserted += 1
+                    result = await session.execute(stmt)
+                    inserted += len(result.all())
             await session.commit()
+            logger.debug(
+                "rows_bulk_inserted",
+                supplier=config.supplier,
+                submitted=len(rows),
+                inserted=inserted,
+            )
             return inserted
 
+    @classmethod
+    def _rows_params(cls, records: list[IngestRow], supplier_id: int) -> Iterator[dict[str, Any]]:
+        return (cls._insert_params(supplier_id, data) for data in records)
+
+    @staticmethod
+    def _batch_params(
+        batch: TariffBatch, metadata: IngestBatchMetadata, supplier_id: int
+    ) -> Iterator[dict[str, Any]]:
+        source_url = str(metadata.source_url)
+        for option, puissance, abo, price, price_hp, price_hc in zip(
+            batch.option,
+            batch.puissance_kva,
+            batch.abo_month_ttc,
+            batch.price_kwh_ttc,
+            batch.price_kwh_hp_ttc,
+            batch.price_kwh_hc_ttc,
+        ):
+            yield {
+                "supplier_id": supplier_id,
+                "option": option,
+                "puissance_kva": puissance,
+                "price_kwh_ttc": price,
+                "price_kwh_hp_ttc": price_hp,
+                "price_kwh_hc_ttc": price_hc,
+                "abo_month_ttc": abo,
+                "observed_at": metadata.observed_at,
+                "parser_version": metadata.parser_version,
+                "source_url": source_url,
+                "source_checksum": metadata.source_checksum,
+            }
+
+    @staticmethod
+    def _insert_params(supplier_id: int, data: IngestRow) -> dict[str, Any]:
+        return {
+            "supplier_id": supplier_id,
+            "option": data.option,
+            "puissance_kva": data.puissance_kva,
+            "price_kwh_ttc": data.price_kwh_ttc,
+            "price_kwh_hp_ttc": data.price_kwh_hp_ttc,
+            "price_kwh_hc_ttc": data.price_kwh_hc_ttc,
+            "abo_month_ttc": data.abo_month_ttc,
+            "observed_at": data.observed_at,
+            "parser_version": data.parser_version,
+            "source_url": str(data.source_url),
+            "source_checksum": data.source_checksum,
+        }
+
+    async def _insert_row_by_row(
+        self, session: AsyncSession, params: Iterable[dict[str, Any]]
+    ) -> int:
+        """Fallback for dialects without ON CONFLICT support."""
+        inserted = 0
+        for values in params:
+            if await self._row_exists(session, values):
+                logger.debug(
+                    "row_skipped_exists",
+                    option=values["option"],
+                    puissance=values["puissance_kva"],
+                )
+                continue
+            session.add(Tariff(**values))
+            inserted += 1
+        return inserted
+
     async def _ensure_supplier(self, session: AsyncSession, config: SupplierConfig) -> int:
         result = await session.execute(select(Supplier).where(Supplier.name == config.supplier))
         supplier = result.scalar_one_or_none()
@@ -84,14 +213,9 @@ class TariffPersister:
         await session.flush()
         return supplier.id
 
-    async def _row_exists(self, session: AsyncSession, supplier_id: int, data: IngestRow) -> bool:
+    async def _row_exists(self, session: AsyncSession, values: dict[str, Any]) -> bool:
         stmt = select(Tariff.id).where(
-            Tariff.supplier_id == supplier_id,
-            Tariff.option == data.option,
-            Tariff.puissance_kva == data.puissance_kva,
-            Tariff.observed_at == data.observed_at,
-            Tariff.parser_version == data.parser_version,
-            Tariff.source_checksum == data.source_checksum,
+            *(getattr(Tariff, column) == values[column] for column in UQ_TARIFFS_OBS_COLUMNS)
         )
         result = await session.execute(stmt.limit(1))
         return result.scalar_one_or_none() is not None
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import gzip
+import json
+import textwrap
 from datetime import datetime, timezone
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+import orjson
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from ingest.fetch import fetch_supplier_artifact
+from ingest.fetch import (
+    DEFAULT_MAX_BYTES,
+    FetchMetadataStore,
+    FetchResult,
+    fetch_supplier_artifact,
+)
 from ingest.persist import TariffPersister
 from parsers.core import parser as yaml_parser
+from parsers.core.batch import TariffBatch
 from parsers.core.config import SupplierConfig, load_supplier_config
 from api.app.core.logging import configure_logging, get_logger
 from api.app.core.sentry import configure_sentry
@@ -19,6 +30,7 @@ from api.app.db.session import get_session_factory
 logger = get_logger(__name__)
 
 DEFAULT_PARSED_DIR = Path("artifacts/parsed")
+OUTPUT_FORMATS = ("json", "ndjson")
 
 
 class IngestRunLogger:
@@ -40,6 +52,26 @@ class IngestRunLogger:
             await session.refresh(run)
             return run.id
 
+    async def last_successful_checksum(self, supplier: str, source_url: str) -> str | None:
+        """Checksum of the latest successful (or unchanged) run for this supplier source.
+
+        Filtered by ``source_url`` too: several configs share a supplier name.
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(IngestRun.source_checksum)
+                .where(
+                    IngestRun.supplier == supplier,
+                    IngestRun.source_url == source_url,
+                    IngestRun.status.in_(("success", "unchanged")),
+                    IngestRun.source_checksum.is_not(None),
+                )
+                .order_by(IngestRun.finished_at.desc())
+                .limit(1)
+            )
+            checksum = result.scalar_one_or_none()
+            return checksum.strip() if checksum else None
+
     async def complete_run(
         self,
         run_id: int,
@@ -61,11 +93,109 @@ class IngestRunLogger:
                 await session.commit()
 
 
+async def skip_unchanged_artifact(
+    run_logger: IngestRunLogger | None,
+    run_id: int | None,
+    config: SupplierConfig,
+    fetch_result: FetchResult,
+    metadata_store: FetchMetadataStore,
+    *,
+    force: bool = False,
+) -> bool:
+    """Close the run as ``unchanged`` when there is nothing new to parse or persist.
+
+    That is a 304 from the source or, unless ``force``, a download whose checksum equals
+    the last ``success``/``unchanged`` run of the same supplier source (the fresh validators
+    are then saved so the next fetch can be conditional). Returns True when the caller
+    should stop.
+    """
+    checksum = fetch_result.checksum
+    if not fetch_result.unchanged and run_logger and not force:
+        last_checksum = await run_logger.last_successful_checksum(
+            config.supplier, str(config.source.url)
+        )
+        if last_checksum == checksum:
+            logger.info("artifact_checksum_unchanged", supplier=config.supplier, checksum=checksum)
+            fetch_result.status = "unchanged"
+            metadata_store.save(config, fetch_result.validators)
+    if not fetch_result.unchanged:
+        return False
+
+    logger.info("artifact_unchanged", url=str(config.source.url), checksum=checksum)
+    if run_id and run_logger:
+        await run_logger.complete_run(run_id, status="unchanged", source_checksum=checksum)
+        logger.info("ingest_run_completed", run_id=run_id, status="unchanged")
+    return True
+
+
 def compute_checksum(path: Path) -> str:
     data = path.read_bytes()
     return sha256(data).hexdigest()
 
 
+def write_payload(
+    rows: Iterable[dict[str, Any]] | TariffBatch,
+    *,
+    supplier: str,
+    observed_at: datetime,
+    output_path: Path | None = None,
+    parsed_dir: Path | None = None,
+    output_format: str = "json",
+    compress: bool = False,
+) -> Path:
+    """Write parsed rows (default: artifacts/parsed/<supplier>_<timestamp>.json).
+
+    Records are encoded and written one at a time, so a ``TariffBatch`` is never
+    materialised as a list of dicts. ``json`` matches ``json.dumps(rows, indent=2)``;
+    ``ndjson`` writes one orjson-encoded record per line (``.ndjson``, or ``.ndjson.gz``
+    with ``compress``) that ``read_payload`` turns back into a batch.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output_format!r}")
+    if output_path is None:
+        parsed_dir = parsed_dir or DEFAULT_PARSED_DIR
+        suffix = ".ndjson.gz" if output_format == "ndjson" and compress else f".{output_format}"
+        output_path = (
+            parsed_dir / f"{supplier.lower()}_{observed_at.strftime('%Y%m%dT%H%M%SZ')}{suffix}"
+        )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_format == "ndjson":
+        opener = gzip.open if compress else open
+        with opener(output_path, "wb") as handle:
+            for record in rows:
+                handle.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        return output_path
+
+    with output_path.open("w", encoding="utf-8") as handle:
+        separator = "[\n"
+        for record in rows:
+            encoded = json.dumps(record, indent=2, ensure_ascii=False)
+            handle.write(separator + textwrap.indent(encoded, "  "))
+            separator = ",\n"
+        handle.write("[]\n" if separator == "[\n" else "\n]\n")
+    return output_path
+
+
+def iter_payload(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a parsed payload written by ``write_payload``.
+
+    NDJSON files (optionally gzipped) are read line by line; ``.json`` files are loaded whole.
+    """
+    if path.suffix == ".json":
+        yield from json.loads(path.read_text(encoding="utf-8"))
+        return
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def read_payload(path: Path) -> TariffBatch:
+    """Load a parsed payload as a ``TariffBatch`` ready for ``TariffPersister.persist``."""
+    return TariffBatch.from_records(iter_payload(path))
+
+
 def run_ingest(
     config: SupplierConfig,
     artifact_path: Path,
@@ -85,7 +215,6 @@ def run_ingest(
 if __name__ == "__main__":
     import argparse
     import asyncio
-    import json
     import sys
 
     from api.app.core.config import settings
@@ -101,19 +230,39 @@ if __name__ == "__main__":
     parser.add_argument(
         "--persist", action="store_true", help="Persist parsed rows into the database"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download, parse and persist even if the source has not changed",
+    )
     parser.add_argument("--observed-at", help="ISO timestamp override (default: now UTC)")
     parser.add_argument(
         "--output",
         help=(
-            "Where to write the parsed JSON "
-            "(default: artifacts/parsed/<supplier>_<timestamp>.json)"
+            "Where to write the parsed rows "
+            "(default: artifacts/parsed/<supplier>_<timestamp>.<json|ndjson[.gz]>)"
         ),
     )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="json (indented array) or ndjson (one record per line, streamed)",
+    )
+    parser.add_argument("--gzip", action="store_true", help="Gzip the ndjson output (.ndjson.gz)")
     parser.add_argument(
         "--raw-dir",
         help="Directory to store fetched raw artifacts (default: artifacts/raw)",
     )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f"Abort downloads larger than this many bytes (default: {DEFAULT_MAX_BYTES})",
+    )
     args = parser.parse_args()
+    if args.gzip and args.output_format != "ndjson":
+        parser.error("--gzip requires --output-format ndjson")
 
     configure_logging()
     configure_sentry()
@@ -128,6 +277,9 @@ if __name__ == "__main__":
         run_id: int | None = None
         run_logger: IngestRunLogger | None = None
         checksum: str | None = None
+        raw_dir = Path(args.raw_dir) if args.raw_dir else None
+        metadata_store = FetchMetadataStore(raw_dir / "fetch_meta" if raw_dir else None)
+        fetch_result: FetchResult | None = None
 
         if args.persist and settings.enable_db:
             run_logger = IngestRunLogger()
@@ -139,14 +291,22 @@ if __name__ == "__main__":
 
         try:
             if args.fetch:
-                raw_path, checksum = fetch_supplier_artifact(
-                    config, raw_dir=Path(args.raw_dir) if args.raw_dir else None
+                fetch_result = fetch_supplier_artifact(
+                    config,
+                    raw_dir=raw_dir,
+                    metadata_store=None if args.force else metadata_store,
+                    max_bytes=args.max_bytes,
                 )
-                artifact_path = raw_path
+                checksum = fetch_result.checksum
+                if await skip_unchanged_artifact(
+                    run_logger, run_id, config, fetch_result, metadata_store, force=args.force
+                ):
+                    return
+                artifact_path = fetch_result.path
                 logger.info(
                     "artifact_fetched",
                     url=str(config.source.url),
-                    path=str(raw_path),
+                    path=str(artifact_path),
                     checksum=checksum,
                 )
             else:
@@ -165,25 +325,20 @@ if __name__ == "__main__":
                     parser.error(f"Artifact not found: {artifact_path}")
                 checksum = compute_checksum(artifact_path)
 
-            rows = run_ingest(
+            rows = yaml_parser.parse_file_batch(
                 config,
                 artifact_path,
                 observed_at=observed,
                 source_checksum=checksum,
             )
 
-            if args.output:
-                output_path = Path(args.output)
-            else:
-                DEFAULT_PARSED_DIR.mkdir(parents=True, exist_ok=True)
-                safe_supplier = args.supplier.lower()
-                output_path = (
-                    DEFAULT_PARSED_DIR
-                    / f"{safe_supplier}_{observed.strftime('%Y%m%dT%H%M%SZ')}.json"
-                )
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(
-                json.dumps(rows, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+            output_path = write_payload(
+                rows,
+                supplier=args.supplier,
+                observed_at=observed,
+                output_path=Path(args.output) if args.output else None,
+                output_format=args.output_format,
+                compress=args.gzip,
             )
             logger.info("payload_written", path=str(output_path), row_count=len(rows))
 
@@ -203,6 +358,10 @@ if __name__ == "__main__":
                         source_checksum=checksum,
                     )
                     logger.info("ingest_run_completed", run_id=run_id, status="success")
+                # Only once the rows are committed: a dry run must not turn the next
+                # persisted run into a 304 that never reaches the database.
+                if fetch_result:
+                    metadata_store.save(config, fetch_result.validators)
             elif run_id and run_logger:
                 await run_logger.complete_run(
                     run_id,
@@ -1,16 +1,20 @@
 """Rate limiter for HTTP requests to avoid being blocked by suppliers.
 
-Implements token bucket algorithm with per-domain rate limiting.
+Implements token bucket algorithm with per-domain rate limiting, in a thread-safe
+blocking flavour (``RateLimiter``) and an asyncio flavour (``AsyncRateLimiter``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections import defaultdict
 from threading import Lock
 from typing import DefaultDict
 from urllib.parse import urlparse
 
+from parsers.core.config import SupplierConfig
+
 
 class RateLimiter:
     """Thread-safe rate limiter using token bucket algorithm.
@@ -95,5 +99,111 @@ class RateLimiter:
             return {domain: bucket.copy() for domain, bucket in self._buckets.items()}
 
 
+class AsyncRateLimiter:
+    """Asyncio token-bucket limiter with per-domain rates and fair (FIFO) waiters.
+
+    Each domain has its own bucket and ``asyncio.Lock``; the lock wakes waiters in arrival
+    order and only serialises callers of the same domain, so different suppliers are
+    fetched in parallel while each domain keeps its own safe rate.
+
+    Example:
+        >>> limiter = AsyncRateLimiter(requests_per_second=0.2)
+        >>> limiter.configure("particulier.edf.fr", requests_per_second=0.5, burst_size=2)
+        >>> await limiter.acquire("https://particulier.edf.fr/tarif.pdf")
+    """
+
+    def __init__(self, requests_per_second: float = 0.2, burst_size: int = 1):
+        """Initialize limiter.
+
+        Args:
+            requests_per_second: Rate used for domains without explicit configuration
+            burst_size: Burst size used for domains without explicit configuration
+        """
+        self.rate = requests_per_second
+        self.burst_size = burst_size
+        self._limits: dict[str, tuple[float, int]] = {}
+        self._buckets: dict[str, dict] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _get_domain(url: str) -> str:
+        """Extract domain from a URL (bare domains are returned unchanged)."""
+        parsed = urlparse(url)
+        return parsed.netloc or parsed.path or "default"
+
+    def configure(
+        self, url_or_domain: str, requests_per_second: float, burst_size: int = 1
+    ) -> None:
+        """Set the rate of a domain; when several sources share it the strictest wins."""
+        domain = self._get_domain(url_or_domain)
+        if domain in self._limits:
+            current_rate, current_burst = self._limits[domain]
+            requests_per_second = min(current_rate, requests_per_second)
+            burst_size = min(current_burst, burst_size)
+        self._limits[domain] = (requests_per_second, burst_size)
+
+    def configure_source(self, config: SupplierConfig) -> None:
+        """Apply the ``source.rate_limit`` block of a supplier config, if any."""
+        if config.source.rate_limit:
+            self.configure(
+                str(config.source.url),
+                requests_per_second=config.source.rate_limit.requests_per_second,
+                burst_size=config.source.rate_limit.burst_size,
+            )
+
+    def _limit(self, domain: str) -> tuple[float, int]:
+        return self._limits.get(domain, (self.rate, self.burst_size))
+
+    async def acquire(self, url: str) -> float:
+        """Wait until a request to ``url``'s domain is allowed.
+
+        Args:
+            url: URL to rate limit
+
+        Returns:
+            Time waited in seconds (0 if no wait needed)
+        """
+        domain = self._get_domain(url)
+        rate, burst_size = self._limit(domain)
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        waited = 0.0
+        async with lock:
+            bucket = self._buckets.setdefault(
+                domain, {"tokens": float(burst_size), "last_update": time.monotonic()}
+            )
+            self._refill(bucket, rate, burst_size)
+            if bucket["tokens"] < 1.0:
+                waited = (1.0 - bucket["tokens"]) / rate
+                await asyncio.sleep(waited)
+                self._refill(bucket, rate, burst_size)
+            bucket["tokens"] = max(bucket["tokens"] - 1.0, 0.0)
+        return waited
+
+    @staticmethod
+    def _refill(bucket: dict, rate: float, burst_size: int) -> None:
+        now = time.monotonic()
+        elapsed = now - bucket["last_update"]
+        bucket["tokens"] = min(burst_size, bucket["tokens"] + elapsed * rate)
+        bucket["last_update"] = now
+
+    def get_stats(self) -> dict[str, dict]:
+        """Get current limiter state per domain.
+
+        Returns:
+            Dict mapping domain to {tokens, last_update, rate, burst_size, locked}
+        """
+        stats = {}
+        for domain, bucket in self._buckets.items():
+            rate, burst_size = self._limit(domain)
+            lock = self._locks.get(domain)
+            stats[domain] = {
+                **bucket,
+                "rate": rate,
+                "burst_size": burst_size,
+                "locked": bool(lock and lock.locked()),
+            }
+        return stats
+
+
 # Global rate limiter instance
 default_rate_limiter = RateLimiter(requests_per_second=0.2)  # 1 req / 5 sec
@@ -0,0 +1,131 @@
+"""Columnar container for the tariff rows parsed from one artifact.
+
+Every row parsed from a file shares supplier, parser version, source URL/checksum,
+observation time and freshness status. ``TariffBatch`` stores those once and keeps the
+per-row values (option, puissance, prices) in parallel lists, so memory and validation
+grow with the number of rows rather than rows x fields. Record dicts are only built on
+demand, one at a time, by ``iter_records``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from api.app.models.enums import FreshnessStatus
+
+METADATA_FIELDS = (
+    "supplier",
+    "parser_version",
+    "source_url",
+    "source_checksum",
+    "observed_at",
+    "data_status",
+)
+PRICE_FIELDS = ("abo_month_ttc", "price_kwh_ttc", "price_kwh_hp_ttc", "price_kwh_hc_ttc")
+
+
+@dataclass
+class TariffBatch:
+    supplier: str
+    parser_version: str
+    source_url: str
+    source_checksum: str
+    observed_at: str
+    data_status: str = FreshnessStatus.FRESH.value
+    option: list[str] = field(default_factory=list)
+    puissance_kva: list[int | None] = field(default_factory=list)
+    abo_month_ttc: list[float | None] = field(default_factory=list)
+    price_kwh_ttc: list[float | None] = field(default_factory=list)
+    price_kwh_hp_ttc: list[float | None] = field(default_factory=list)
+    price_kwh_hc_ttc: list[float | None] = field(default_factory=list)
+    # Any other per-row field an HTML selector config extracts, kept as columns too.
+    extras: dict[str, list[Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_template(cls, template: dict[str, Any]) -> "TariffBatch":
+        return cls(**{name: template[name] for name in METADATA_FIELDS if name in template})
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]], **metadata: Any) -> "TariffBatch":
+        """Build a batch from row dicts; raises ``ValueError`` if their metadata differs."""
+        batch: TariffBatch | None = cls(**metadata) if metadata else None
+        for record in records:
+            if batch is None:
+                batch = cls.from_template(record)
+            elif any(
+                name in record and record[name] != getattr(batch, name) for name in METADATA_FIELDS
+            ):
+                raise ValueError("All rows of a TariffBatch must share the same metadata")
+            batch.append(**{k: v for k, v in record.items() if k not in METADATA_FIELDS})
+        if batch is None:
+            raise ValueError("Cannot infer TariffBatch metadata from an empty row list")
+        return batch
+
+    def append(
+        self,
+        *,
+        option: str,
+        puissance_kva: int | None,
+        abo_month_ttc: float | None = None,
+        price_kwh_ttc: float | None = None,
+        price_kwh_hp_ttc: float | None = None,
+        price_kwh_hc_ttc: float | None = None,
+        **extras: Any,
+    ) -> None:
+        row_count = len(self.option)
+        self.option.append(option)
+        self.puissance_kva.append(puissance_kva)
+        self.abo_month_ttc.append(abo_month_ttc)
+        self.price_kwh_ttc.append(price_kwh_ttc)
+        self.price_kwh_hp_ttc.append(price_kwh_hp_ttc)
+        self.price_kwh_hc_ttc.append(price_kwh_hc_ttc)
+        for name in self.extras.keys() - extras.keys():
+            self.extras[name].append(None)
+        for name, value in extras.items():
+            self.extras.setdefault(name, [None] * row_count).append(value)
+
+    def extend(self, other: "TariffBatch") -> None:
+        if self.metadata() != other.metadata():
+            raise ValueError("Cannot merge TariffBatches with different metadata")
+        for record in other.iter_rows():
+            self.append(**record)
+
+    def __len__(self) -> int:
+        return len(self.option)
+
+    def metadata(self) -> dict[str, str]:
+        return {name: getattr(self, name) for name in METADATA_FIELDS}
+
+    def columns(self) -> dict[str, list[Any]]:
+        """Per-row columns by field name (the lists themselves, not copies)."""
+        columns = {
+            "option": self.option,
+            "puissance_kva": self.puissance_kva,
+            **{name: getattr(self, name) for name in PRICE_FIELDS},
+        }
+        columns.update(self.extras)
+        return columns
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Per-row values only (no metadata); unset prices are left out."""
+        columns = self.columns()
+        for index in range(len(self)):
+            row = {}
+            for name, values in columns.items():
+                value = values[index]
+                if value is not None or name not in PRICE_FIELDS:
+                    row[name] = value
+            yield row
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Yield full record dicts (metadata + row values) one at a time."""
+        metadata = self.metadata()
+        for row in self.iter_rows():
+            yield {**metadata, **row}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.iter_records()
+
+    def to_records(self) -> list[dict[str, Any]]:
+        return list(self.iter_records())
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
+from hashlib import sha256
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+from api.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimitConfig(BaseModel):
+    requests_per_second: float = Field(0.2, gt=0)
+    burst_size: int = Field(1, ge=1)
 
 
 class SourceConfig(BaseModel):
     url: HttpUrl
     format: Literal["html", "pdf"] = "html"
+    rate_limit: RateLimitConfig | None = None
 
 
 class SelectorConfig(BaseModel):
     rows: str = Field(..., description="CSS selector returning each tariff row")
     fields: dict[str, str] = Field(default_factory=dict)
+    engine: Literal["html.parser", "lxml"] = Field(
+        "html.parser", description="BeautifulSoup tree builder ('lxml' is much faster)"
+    )
+    container: Optional[str] = Field(
+        None,
+        description=(
+            "CSS selector of the element holding the rows (first match); `rows` is matched "
+            "inside it only and cannot refer to its ancestors"
+        ),
+    )
 
 
 class PdfSliceConfig(BaseModel):
@@ -32,8 +56,22 @@ class PdfTableConfig(BaseModel):
     table_index: int = 0
     skip_rows: int = 0
     use_clean_rows: bool = False
+    bbox: Optional[tuple[float, float, float, float]] = Field(
+        None,
+        description="(x0, top, x1, bottom) in PDF points; the page is cropped to it first",
+    )
+    table_settings: Optional[dict[str, Any]] = Field(
+        None, description="pdfplumber table settings, e.g. vertical_strategy: text"
+    )
     slices: list[PdfSliceConfig]
 
+    @field_validator("bbox")
+    @classmethod
+    def _check_bbox(cls, bbox):
+        if bbox is not None and not (bbox[0] < bbox[2] and bbox[1] < bbox[3]):
+            raise ValueError("bbox must be (x0, top, x1, bottom) with x0 < x1 and top < bottom")
+        return bbox
+
 
 class PdfConfig(BaseModel):
     tables: list[PdfTableConfig]
@@ -64,9 +102,109 @@ class SupplierConfig(BaseModel):
         return instance
 
 
+DEFAULT_CONFIG_DIR = Path("parsers/config")
+DEFAULT_CHECK_INTERVAL = 5.0
+
+
+@dataclass
+class _RegistryEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    config: SupplierConfig | None = None
+    error: Exception | None = None
+
+
+class SupplierConfigRegistry:
+    """Process-wide cache of validated supplier configs.
+
+    Every YAML under ``config_dir`` is loaded and validated once. The directory is
+    re-scanned at most every ``check_interval`` seconds; a file is re-read only when its
+    mtime or size changed, and re-validated only when its content hash changed. Lookups
+    in between touch neither the filesystem nor YAML.
+    """
+
+    def __init__(
+        self,
+        config_dir: Path = DEFAULT_CONFIG_DIR,
+        *,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ):
+        self.config_dir = config_dir
+        self.check_interval = check_interval
+        self._entries: dict[str, _RegistryEntry] = {}
+        self._last_scan: float | None = None
+        self._lock = threading.Lock()
+
+    def get(self, supplier: str) -> SupplierConfig:
+        slug = supplier.lower()
+        self.refresh()
+        if slug not in self._entries:
+            # A file added since the last scan should not wait for the next interval.
+            self.refresh(force=True)
+        entry = self._entries.get(slug)
+        if entry is None:
+            config_path = self.config_dir / f"{slug}.yaml"
+            raise FileNotFoundError(
+                f"No YAML config found for supplier '{supplier}' at {config_path}"
+            )
+        if entry.error is not None:
+            raise entry.error
+        return entry.config
+
+    def slugs(self) -> list[str]:
+        """Sorted config file stems (the identifiers ``ingest.pipeline`` accepts)."""
+        self.refresh()
+        return sorted(self._entries)
+
+    def refresh(self, *, force: bool = False) -> None:
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_scan is not None
+            and now - self._last_scan < self.check_interval
+        ):
+            return
+        with self._lock:
+            entries: dict[str, _RegistryEntry] = {}
+            for config_path in sorted(self.config_dir.glob("*.yaml")):
+                entries[config_path.stem] = self._load(config_path)
+            self._entries = entries
+            self._last_scan = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._last_scan = None
+
+    def _load(self, config_path: Path) -> _RegistryEntry:
+        stat = config_path.stat()
+        current = self._entries.get(config_path.stem)
+        if current and (current.mtime_ns, current.size) == (stat.st_mtime_ns, stat.st_size):
+            return current
+        raw = config_path.read_bytes()
+        digest = sha256(raw).hexdigest()
+        if current and current.digest == digest:
+            current.mtime_ns, current.size = stat.st_mtime_ns, stat.st_size
+            return current
+        entry = _RegistryEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+        try:
+            entry.config = SupplierConfig.model_validate(yaml.safe_load(raw.decode("utf-8")))
+        except Exception as exc:  # surfaced on get(), other suppliers stay usable
+            logger.warning("supplier_config_invalid", path=str(config_path), error=str(exc))
+            entry.error = exc
+        return entry
+
+
+_registry: SupplierConfigRegistry | None = None
+
+
+def get_config_registry() -> SupplierConfigRegistry:
+    global _registry
+    if _registry is None:
+        _registry = SupplierConfigRegistry()
+    return _registry
+
+
 def load_supplier_config(supplier: str) -> SupplierConfig:
-    config_path = Path("parsers/config") / f"{supplier.lower()}.yaml"
-    if not config_path.exists():
-        raise FileNotFoundError(f"No YAML config found for supplier '{supplier}' at {config_path}")
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
-    return SupplierConfig.model_validate(data)
+    return get_config_registry().get(supplier)
@@ -0,0 +1,74 @@
+"""Numeric cell parsing for extracted tariff tables.
+
+Cells look like ``"12,34 €"``, ``"19.52 cts"`` or ``"-"``. Parsing keeps only digits,
+sign and decimal point (after turning the French decimal comma into a dot), so the
+currency/unit suffixes need no dedicated handling. The column/table helpers clean every
+cell with a single regex pass over the joined text and return float64 arrays with NaN
+where a cell holds no number; history backfills re-parse thousands of grids this way.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Sequence
+
+import numpy as np
+
+_NON_NUMERIC = re.compile(r"[^0-9.+-]")
+# Same as above but keeps the separator used to join a whole column into one string.
+_NON_NUMERIC_JOINED = re.compile(r"[^0-9.+\-\x1f]")
+_CELL_SEPARATOR = "\x1f"
+_INTEGER = re.compile(r"\d+")
+_NO_VALUE = {"", "-", "--"}
+
+
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _to_float(text: str) -> float:
+    if text in _NO_VALUE:
+        return np.nan
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def parse_float(value: Any) -> float | None:
+    """Parse one cell; ``None`` when it holds no number."""
+    number = _to_float(_NON_NUMERIC.sub("", _cell_text(value).replace(",", ".")))
+    return None if np.isnan(number) else number
+
+
+def parse_int(value: Any) -> int | None:
+    """First run of digits in the cell (e.g. ``"6 kVA"`` -> 6)."""
+    match = _INTEGER.search(_cell_text(value))
+    return int(match.group()) if match else None
+
+
+def parse_float_column(cells: Sequence[Any]) -> np.ndarray:
+    """Parse a column of cells into a float64 array (NaN for empty/invalid cells)."""
+    texts = [_cell_text(cell) for cell in cells]
+    joined = _CELL_SEPARATOR.join(texts)
+    if joined.count(_CELL_SEPARATOR) != max(len(texts) - 1, 0):
+        # A cell contains the separator itself; clean cell by cell instead.
+        cleaned = [_NON_NUMERIC.sub("", text.replace(",", ".")) for text in texts]
+    else:
+        cleaned = _NON_NUMERIC_JOINED.sub("", joined.replace(",", ".")).split(_CELL_SEPARATOR)
+    if not texts:
+        return np.empty(0, dtype=np.float64)
+    try:
+        return np.array(
+            ["nan" if text in _NO_VALUE else text for text in cleaned], dtype=np.float64
+        )
+    except ValueError:
+        # Leftovers such as "1.2.3" or "+": fall back to per-cell conversion.
+        return np.array([_to_float(text) for text in cleaned], dtype=np.float64)
+
+
+def parse_float_table(rows: Sequence[Sequence[Any]]) -> np.ndarray:
+    """Parse a (possibly ragged) table into a 2-D float64 array padded with NaN."""
+    width = max((len(row) for row in rows), default=0)
+    cells = [cell for row in rows for cell in (*row, *([None] * (width - len(row))))]
+    return parse_float_column(cells).reshape(len(rows), width)
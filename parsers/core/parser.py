@@ -1,22 +1,74 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 
-from api.app.models.enums import FreshnessStatus, TariffOption
+from api.app.models.enums import TariffOption
 from parsers.core.config import SupplierConfig
 from parsers.core import pdf_parser
+from parsers.core.batch import TariffBatch
 
 NUMERIC_FIELDS = {"abo_month_ttc", "price_kwh_ttc", "price_kwh_hp_ttc", "price_kwh_hc_ttc"}
 INT_FIELDS = {"puissance_kva"}
 
+# Container selectors simple enough to become a SoupStrainer: tag, #id, .class and
+# combinations such as table#grid or div.tarifs.
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<name>[A-Za-z][\w-]*)?(?:#(?P<id>[\w-]+))?(?:\.(?P<cls>[\w-]+))?$"
+)
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once per process (``select``/``select_one`` recompile)."""
+    return soupsieve.compile(selector)
+
+
+def _strainer_for(selector: str) -> SoupStrainer | None:
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not any(match.groupdict().values()):
+        return None
+    attrs: dict[str, str] = {}
+    if match["id"]:
+        attrs["id"] = match["id"]
+    if match["cls"]:
+        attrs["class"] = match["cls"]
+    return SoupStrainer(match["name"], attrs=attrs)
+
 
 class YamlTariffParser:
     def __init__(self, config: SupplierConfig):
         self.config = config
+        selectors = config.selectors
+        self._rows = compile_selector(selectors.rows) if selectors else None
+        self._fields = {
+            field: expr if expr.startswith("@") else compile_selector(expr)
+            for field, expr in (selectors.fields.items() if selectors else ())
+        }
+
+    def _parse_tree(self, html: str):
+        """Parse ``html`` with the configured engine, restricted to the container if any.
+
+        The container is the first element matching ``selectors.container``, whether or
+        not the selector is simple enough to become a strainer. It is detached from the
+        document, so row selectors only see its subtree, never its ancestors.
+        """
+        selectors = self.config.selectors
+        container = selectors.container
+        strainer = _strainer_for(container) if container else None
+        # A strainer keeps every match (and drops their ancestors); a complex selector
+        # needs the whole document. Either way, narrow down to the first match.
+        soup = BeautifulSoup(html, selectors.engine, parse_only=strainer)
+        if not container:
+            return soup
+        root = compile_selector(container).select_one(soup)
+        return root.extract() if root is not None else None
 
     def parse_html(
         self,
@@ -25,35 +77,43 @@ class YamlTariffParser:
         observed_at: datetime,
         source_checksum: str,
     ) -> list[dict[str, Any]]:
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.select(self.config.selectors.rows)
-        parsed: list[dict[str, Any]] = []
-        observed_iso = observed_at.isoformat().replace("+00:00", "Z")
+        return self.parse_html_batch(
+            html, observed_at=observed_at, source_checksum=source_checksum
+        ).to_records()
+
+    def parse_html_batch(
+        self,
+        html: str,
+        *,
+        observed_at: datetime,
+        source_checksum: str,
+    ) -> TariffBatch:
+        root = self._parse_tree(html)
+        rows = self._rows.select(root) if root is not None else []
+        batch = TariffBatch.from_template(
+            pdf_parser.payload_template(
+                self.config, observed_at=observed_at, source_checksum=source_checksum
+            )
+        )
         for row in rows:
-            payload: dict[str, Any] = {
-                "supplier": self.config.supplier,
-                "parser_version": self.config.parser_version,
-                "source_url": str(self.config.source.url),
-                "source_checksum": source_checksum,
-                "observed_at": observed_iso,
-                "data_status": FreshnessStatus.FRESH.value,
-            }
-            for field, expr in self.config.selectors.fields.items():
+            values: dict[str, Any] = {}
+            for field, expr in self._fields.items():
                 raw = self._extract_value(row, expr)
-                payload[field] = self._cast_field(field, raw)
-            option_value = (payload.get("option") or row.get("data-option", "BASE")).upper()
+                values[field] = self._cast_field(field, raw)
+            option_value = (values.get("option") or row.get("data-option", "BASE")).upper()
             try:
-                payload["option"] = TariffOption(option_value).value
+                values["option"] = TariffOption(option_value).value
             except ValueError:
-                payload["option"] = option_value
-            parsed.append(payload)
-        return parsed
+                values["option"] = option_value
+            values.setdefault("puissance_kva", None)
+            batch.append(**values)
+        return batch
 
     @staticmethod
-    def _extract_value(node, expr: str) -> Any:
-        if expr.startswith("@"):
+    def _extract_value(node, expr: str | soupsieve.SoupSieve) -> Any:
+        if isinstance(expr, str):
             return node.get(expr[1:])
-        target = node.select_one(expr)
+        target = expr.select_one(node)
         return target.text.strip() if target else None
 
     @staticmethod
@@ -74,10 +134,23 @@ def parse_file(
     observed_at: datetime,
     source_checksum: str,
 ) -> list[dict[str, Any]]:
+    return parse_file_batch(
+        config, artifact_path, observed_at=observed_at, source_checksum=source_checksum
+    ).to_records()
+
+
+def parse_file_batch(
+    config: SupplierConfig,
+    artifact_path: Path,
+    *,
+    observed_at: datetime,
+    source_checksum: str,
+) -> TariffBatch:
+    """Parse an artifact into a columnar ``TariffBatch`` (see ``parse_file`` for dicts)."""
     if config.source.format == "pdf":
-        return pdf_parser.parse_pdf(
+        return pdf_parser.parse_pdf_batch(
             config, artifact_path, observed_at=observed_at, source_checksum=source_checksum
         )
     parser = YamlTariffParser(config)
     html = artifact_path.read_text(encoding="utf-8")
-    return parser.parse_html(html, observed_at=observed_at, source_checksum=source_checksum)
+    return parser.parse_html_batch(html, observed_at=observed_at, source_checksum=source_checksum)
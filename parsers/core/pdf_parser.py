@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
+import json
+import tracemalloc
 from datetime import datetime
-import re
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Mapping, Sequence
 
 import pdfplumber
 
+from api.app.core.logging import get_logger
 from api.app.models.enums import FreshnessStatus, TariffOption
-from parsers.core.config import PdfSliceConfig, SupplierConfig
+from parsers.core import numeric
+from parsers.core.batch import TariffBatch
+from parsers.core.config import PdfSliceConfig, PdfTableConfig, SupplierConfig
+
+logger = get_logger(__name__)
 
 
 def normalize_text(value: Any) -> str:
@@ -18,24 +26,11 @@ def normalize_text(value: Any) -> str:
 
 
 def parse_float(value: Any) -> float | None:
-    text = normalize_text(value)
-    if not text:
-        return None
-    text = text.replace("\u20ac", "").replace("cts", "").replace("Cts", "").replace("%", "")
-    text = text.replace(",", ".")
-    text = re.sub(r"[^0-9.+-]", "", text)
-    if not text or text in {"-", "--"}:
-        return None
-    try:
-        return float(text)
-    except ValueError:
-        return None
+    return numeric.parse_float(value)
 
 
 def parse_int_value(value: Any) -> int | None:
-    text = normalize_text(value)
-    match = re.search(r"\d+", text)
-    return int(match.group()) if match else None
+    return numeric.parse_int(value)
 
 
 def resolve_row(row: Sequence[str], use_clean: bool) -> list[str]:
@@ -45,92 +40,338 @@ def resolve_row(row: Sequence[str], use_clean: bool) -> list[str]:
     return normalized
 
 
+@dataclass
+class PdfParseStats:
+    """Counters filled by ``parse_pdf`` when a stats object is passed in."""
+
+    extractions: int = 0
+    cache_hits: int = 0
+    pages_opened: int = 0
+    pages_released: int = 0
+    # Peak Python heap allocated by this parse (tracemalloc, KiB), with ``trace_memory``.
+    peak_traced_kib: int | None = None
+
+
+class _TableCache:
+    """Memoize ``extract_tables`` per (page index, settings, bbox) for one open document.
+
+    Several configs declare more than one table on the same page; without the cache each
+    of them re-runs the (expensive) table detection on identical input. When ``page_uses``
+    is given, a page's layout objects (chars, lines, rects) are flushed as soon as its last
+    table has been extracted instead of living until the document closes.
+    """
+
+    def __init__(
+        self,
+        pages: Mapping[int, Any] | Sequence[Any],
+        stats: PdfParseStats,
+        page_uses: Counter[int] | None = None,
+    ):
+        self._pages = pages
+        self._stats = stats
+        self._page_uses = page_uses
+        self._tables: dict[tuple[int, str, tuple | None], list] = {}
+
+    def extract(
+        self,
+        page_index: int,
+        settings: dict[str, Any] | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> list:
+        key = (page_index, json.dumps(settings or {}, sort_keys=True, default=str), bbox)
+        if key in self._tables:
+            self._stats.cache_hits += 1
+            tables = self._tables[key]
+        else:
+            try:
+                page = self._pages[page_index]
+            except (IndexError, KeyError):
+                raise IndexError(f"Page {page_index} not found in PDF") from None
+            if bbox is not None:
+                # Only the objects inside the grid are considered by table detection.
+                page = page.crop(bbox)
+            tables = page.extract_tables(settings)
+            self._stats.extractions += 1
+            self._tables[key] = tables
+        self._release_if_done(page_index)
+        return tables
+
+    def _release_if_done(self, page_index: int) -> None:
+        if self._page_uses is None:
+            return
+        self._page_uses[page_index] -= 1
+        if self._page_uses[page_index] == 0:
+            self._pages[page_index].close()
+            self._stats.pages_released += 1
+
+    def clear(self) -> None:
+        self._tables.clear()
+
+
 def parse_pdf(
     config: SupplierConfig,
     artifact_path: Path,
     *,
     observed_at: datetime,
     source_checksum: str,
+    stats: PdfParseStats | None = None,
+    low_memory: bool = True,
+    trace_memory: bool = False,
 ) -> list[dict[str, Any]]:
+    """Parse the tables declared in ``config.pdf`` into tariff payloads (row dicts)."""
+    return parse_pdf_batch(
+        config,
+        artifact_path,
+        observed_at=observed_at,
+        source_checksum=source_checksum,
+        stats=stats,
+        low_memory=low_memory,
+        trace_memory=trace_memory,
+    ).to_records()
+
+
+def parse_pdf_batch(
+    config: SupplierConfig,
+    artifact_path: Path,
+    *,
+    observed_at: datetime,
+    source_checksum: str,
+    stats: PdfParseStats | None = None,
+    low_memory: bool = True,
+    trace_memory: bool = False,
+) -> TariffBatch:
+    """Parse the tables declared in ``config.pdf`` into a columnar ``TariffBatch``.
+
+    With ``low_memory`` (the default) only the pages referenced by the config are loaded
+    and each page's object cache is flushed once its tables are extracted, so memory stays
+    flat for long booklets. Pass ``low_memory=False`` to open every page as before.
+
+    ``trace_memory`` records the peak heap allocated by this parse alone in
+    ``stats.peak_traced_kib``. It runs under tracemalloc, which slows parsing down, so
+    leave it off outside benchmarks and tests.
+    """
     if not config.pdf:
         raise ValueError("PDF parsing requested but no pdf configuration provided.")
 
-    observations: list[dict[str, Any]] = []
+    stats = stats if stats is not None else PdfParseStats()
+    page_uses = Counter(table.page for table in config.pdf.tables)
+    # Negative (from the end) page indexes need the page count, so they load every page.
+    low_memory = low_memory and min(page_uses, default=0) >= 0
+    open_kwargs: dict[str, Any] = {}
+    if low_memory:
+        # pdfplumber page numbers are 1-based; config page indexes are 0-based.
+        open_kwargs["pages"] = [index + 1 for index in sorted(page_uses)]
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0] if trace_memory else 0
 
-    with pdfplumber.open(str(artifact_path)) as pdf:
-        for table_spec in config.pdf.tables:
-            page = pdf.pages[table_spec.page]
-            tables = page.extract_tables()
-            if table_spec.table_index >= len(tables):
-                raise IndexError(
-                    f"Table index {table_spec.table_index} not found on page {table_spec.page}"
+    try:
+        with pdfplumber.open(str(artifact_path), **open_kwargs) as pdf:
+            if low_memory:
+                pages: Mapping[int, Any] | Sequence[Any] = {
+                    page.page_number - 1: page for page in pdf.pages
+                }
+            else:
+                pages = pdf.pages
+            stats.pages_opened = len(pages)
+            cache = _TableCache(pages, stats, page_uses if low_memory else None)
+            try:
+                batch = _parse_tables(
+                    config, cache, observed_at=observed_at, source_checksum=source_checksum
                 )
-            table = tables[table_spec.table_index]
-            data_rows = table[table_spec.skip_rows :]
-            for raw_row in data_rows:
-                for slice_spec in table_spec.slices:
-                    use_clean = (
-                        slice_spec.use_clean_rows
-                        if slice_spec.use_clean_rows is not None
-                        else table_spec.use_clean_rows
-                    )
-                    row = resolve_row(raw_row, use_clean)
-                    record = build_record_from_row(
-                        config,
-                        row,
-                        slice_spec,
-                        observed_at=observed_at,
-                        source_checksum=source_checksum,
-                    )
-                    if record:
-                        observations.append(record)
-
-    return observations
+            finally:
+                cache.clear()
+    finally:
+        if trace_memory:
+            stats.peak_traced_kib = max(tracemalloc.get_traced_memory()[1] - baseline, 0) // 1024
+        if started_tracing:
+            tracemalloc.stop()
 
+    logger.info(
+        "pdf_tables_extracted",
+        supplier=config.supplier,
+        extractions=stats.extractions,
+        cache_hits=stats.cache_hits,
+        pages_opened=stats.pages_opened,
+        peak_traced_kib=stats.peak_traced_kib,
+    )
+    return batch
 
-def build_record_from_row(
-    config: SupplierConfig,
-    row: list[str],
-    slice_spec: PdfSliceConfig,
-    *,
-    observed_at: datetime,
-    source_checksum: str,
-) -> dict[str, Any] | None:
-    if slice_spec.puissance_column >= len(row):
-        return None
-    puissance = parse_int_value(row[slice_spec.puissance_column])
-    if puissance is None:
-        return None
-    if slice_spec.puissance_values and puissance not in slice_spec.puissance_values:
-        return None
-
-    observed_iso = observed_at.isoformat().replace("+00:00", "Z")
-    payload: dict[str, Any] = {
+
+def payload_template(
+    config: SupplierConfig, *, observed_at: datetime, source_checksum: str
+) -> dict[str, Any]:
+    """Fields shared by every record of one parse run."""
+    return {
         "supplier": config.supplier,
         "parser_version": config.parser_version,
         "source_url": str(config.source.url),
         "source_checksum": source_checksum,
-        "observed_at": observed_iso,
+        "observed_at": observed_at.isoformat().replace("+00:00", "Z"),
         "data_status": FreshnessStatus.FRESH.value,
     }
 
-    for field, column_index in slice_spec.columns.items():
-        if column_index >= len(row):
-            return None
-        value = parse_float(row[column_index])
-        # Convert centimes to euros if needed for price fields
-        if value is not None and slice_spec.price_unit == "cts" and "price" in field:
-            value = value / 100.0
-        payload[field] = value
-
-    for field in slice_spec.columns.keys():
-        if payload.get(field) is None:
-            return None
 
-    payload["puissance_kva"] = puissance
+def _resolve_option(option: str) -> str:
     try:
-        payload["option"] = TariffOption(slice_spec.option.upper()).value
+        return TariffOption(option.upper()).value
     except ValueError:
-        payload["option"] = slice_spec.option
+        return option
 
-    return payload
+
+@dataclass(frozen=True)
+class SlicePlan:
+    """A ``PdfSliceConfig`` resolved once: column lookups, unit divisors and option."""
+
+    use_clean: bool
+    puissance_column: int
+    puissance_values: frozenset[int] | None
+    # (field, column index, divisor or None)
+    fields: tuple[tuple[str, int, float | None], ...]
+    min_length: int
+    option: str
+
+    @classmethod
+    def compile(cls, slice_spec: PdfSliceConfig, *, table_use_clean: bool) -> "SlicePlan":
+        use_clean = (
+            slice_spec.use_clean_rows if slice_spec.use_clean_rows is not None else table_use_clean
+        )
+        # Convert centimes to euros for price fields
+        fields = tuple(
+            (
+                field,
+                column_index,
+                100.0 if slice_spec.price_unit == "cts" and "price" in field else None,
+            )
+            for field, column_index in slice_spec.columns.items()
+        )
+        return cls(
+            use_clean=use_clean,
+            puissance_column=slice_spec.puissance_column,
+            puissance_values=(
+                frozenset(slice_spec.puissance_values) if slice_spec.puissance_values else None
+            ),
+            fields=fields,
+            min_length=max((column for _, column, _ in fields), default=-1) + 1,
+            option=_resolve_option(slice_spec.option),
+        )
+
+    def extract(self, row: list[str], values: list[float]) -> dict[str, Any] | None:
+        """Row values (prices, puissance, option) from ``row`` and its parsed floats.
+
+        ``values`` holds NaN where a cell has no number; ``None`` means the row is skipped.
+        """
+        if self.puissance_column >= len(row):
+            return None
+        puissance = parse_int_value(row[self.puissance_column])
+        if puissance is None:
+            return None
+        if self.puissance_values and puissance not in self.puissance_values:
+            return None
+        if self.min_length > len(row):
+            return None
+
+        extracted: dict[str, Any] = {}
+        for field, column_index, divisor in self.fields:
+            value = values[column_index]
+            if value != value:  # NaN
+                return None
+            extracted[field] = value / divisor if divisor else value
+        extracted["puissance_kva"] = puissance
+        extracted["option"] = self.option
+        return extracted
+
+    def build(
+        self, row: list[str], values: list[float], template: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Full record dict: ``template`` metadata plus the extracted row values."""
+        extracted = self.extract(row, values)
+        return {**template, **extracted} if extracted else None
+
+
+@dataclass(frozen=True)
+class TablePlan:
+    """A ``PdfTableConfig`` with its slices compiled and the row modes it needs."""
+
+    page: int
+    table_index: int
+    skip_rows: int
+    bbox: tuple[float, float, float, float] | None
+    table_settings: dict[str, Any] | None
+    slices: tuple[SlicePlan, ...]
+    needs_raw: bool
+    needs_clean: bool
+
+    @classmethod
+    def compile(cls, table_spec: PdfTableConfig) -> "TablePlan":
+        slices = tuple(
+            SlicePlan.compile(slice_spec, table_use_clean=table_spec.use_clean_rows)
+            for slice_spec in table_spec.slices
+        )
+        return cls(
+            page=table_spec.page,
+            table_index=table_spec.table_index,
+            skip_rows=table_spec.skip_rows,
+            bbox=table_spec.bbox,
+            table_settings=table_spec.table_settings,
+            slices=slices,
+            needs_raw=any(not plan.use_clean for plan in slices),
+            needs_clean=any(plan.use_clean for plan in slices),
+        )
+
+    def fill(self, table: list[list[Any]], batch: TariffBatch) -> None:
+        """Append every row of ``table`` matched by a slice to ``batch``."""
+        # Normalize each cell once and parse the numbers of the whole table in one pass;
+        # the clean variant (empty cells dropped) is derived only if a slice needs it.
+        normalized = [resolve_row(raw_row, False) for raw_row in table[self.skip_rows :]]
+        variants: dict[bool, tuple[list[list[str]], list[list[float]]]] = {}
+        if self.needs_raw:
+            variants[False] = (normalized, numeric.parse_float_table(normalized).tolist())
+        if self.needs_clean:
+            clean = [[cell for cell in row if cell] for row in normalized]
+            variants[True] = (clean, numeric.parse_float_table(clean).tolist())
+
+        for index in range(len(normalized)):
+            for plan in self.slices:
+                rows, values = variants[plan.use_clean]
+                extracted = plan.extract(rows[index], values[index])
+                if extracted:
+                    batch.append(**extracted)
+
+
+def _parse_tables(
+    config: SupplierConfig,
+    cache: _TableCache,
+    *,
+    observed_at: datetime,
+    source_checksum: str,
+) -> TariffBatch:
+    batch = TariffBatch.from_template(
+        payload_template(config, observed_at=observed_at, source_checksum=source_checksum)
+    )
+    for plan in (TablePlan.compile(table_spec) for table_spec in config.pdf.tables):
+        tables = cache.extract(plan.page, plan.table_settings, plan.bbox)
+        if plan.table_index >= len(tables):
+            raise IndexError(f"Table index {plan.table_index} not found on page {plan.page}")
+        plan.fill(tables[plan.table_index], batch)
+
+    return batch
+
+
+def build_record_from_row(
+    config: SupplierConfig,
+    row: list[str],
+    slice_spec: PdfSliceConfig,
+    *,
+    observed_at: datetime,
+    source_checksum: str,
+) -> dict[str, Any] | None:
+    """Build one record from an already resolved row (single-row form of ``SlicePlan``)."""
+    plan = SlicePlan.compile(slice_spec, table_use_clean=False)
+    template = payload_template(config, observed_at=observed_at, source_checksum=source_checksum)
+    values = numeric.parse_float_column(row).tolist()
+    return plan.build(row, values, template)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from parsers.core import parser as yaml_parser  # noqa: E402
+from parsers.core.config import get_config_registry  # noqa: E402
+
+DEFAULT_SNAPSHOT_DIR = Path("tests/snapshots")
+DEFAULT_THRESHOLD = 0.20
+OBSERVED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    supplier: str
+    artifact_path: Path
+
+
+def discover_cases(snapshot_dir: Path, suppliers: set[str] | None = None) -> list[BenchCase]:
+    """Pair every snapshot PDF with its supplier config.
+
+    The config slug is the file stem (``total/total_heures_eco.pdf``) or, failing that, the
+    snapshot directory (``edf/edf_tarif_bleu.pdf``). PDFs without a config are skipped.
+    """
+    slugs = set(get_config_registry().slugs())
+    cases = []
+    for path in sorted(snapshot_dir.glob("*/*.pdf")):
+        slug = next((name for name in (path.stem, path.parent.name) if name in slugs), None)
+        if slug is None or (suppliers and slug not in suppliers):
+            continue
+        cases.append(BenchCase(supplier=slug, artifact_path=path))
+    return cases
+
+
+def bench_case(case: BenchCase, *, warmup: int = 1, runs: int = 5) -> dict[str, Any]:
+    """Time ``parse_file`` for one case; memory is measured on a separate traced run."""
+    config = get_config_registry().get(case.supplier)
+    checksum = sha256(case.artifact_path.read_bytes()).hexdigest()
+
+    def _parse() -> list[dict[str, Any]]:
+        return yaml_parser.parse_file(
+            config, case.artifact_path, observed_at=OBSERVED_AT, source_checksum=checksum
+        )
+
+    for _ in range(warmup):
+        _parse()
+
+    wall: list[float] = []
+    cpu: list[float] = []
+    for _ in range(runs):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        rows = _parse()
+        wall.append(time.perf_counter() - wall_start)
+        cpu.append(time.process_time() - cpu_start)
+
+    # tracemalloc slows allocation-heavy code down, so keep it out of the timed runs.
+    tracemalloc.start()
+    try:
+        _parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "supplier": case.supplier,
+        "artifact": str(case.artifact_path),
+        "rows": len(rows),
+        "runs": runs,
+        "wall_median_s": statistics.median(wall),
+        "wall_min_s": min(wall),
+        "wall_max_s": max(wall),
+        "cpu_median_s": statistics.median(cpu),
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def compare(
+    current: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Describe every metric that got worse than ``baseline`` by more than ``threshold``."""
+    previous = {(entry["supplier"], entry["artifact"]): entry for entry in baseline}
+    regressions = []
+    for entry in current:
+        before = previous.get((entry["supplier"], entry["artifact"]))
+        if before is None:
+            continue
+        for metric in ("wall_median_s", "cpu_median_s", "peak_memory_kib"):
+            old, new = before.get(metric), entry[metric]
+            if old and new > old * (1 + threshold):
+                regressions.append(
+                    f"{entry['supplier']} {metric}: {old:.4g} -> {new:.4g} "
+                    f"(+{(new / old - 1) * 100:.0f}%)"
+                )
+        if before.get("rows") is not None and before["rows"] != entry["rows"]:
+            regressions.append(f"{entry['supplier']} rows: {before['rows']} -> {entry['rows']}")
+    return regressions
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    lines = [f"{'supplier':<22} {'rows':>5} {'wall ms':>9} {'cpu ms':>9} {'peak KiB':>10}"]
+    for entry in results:
+        lines.append(
+            f"{entry['supplier']:<22} {entry['rows']:>5} "
+            f"{entry['wall_median_s'] * 1000:>9.1f} {entry['cpu_median_s'] * 1000:>9.1f} "
+            f"{entry['peak_memory_kib']:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark parse_file over the PDF snapshots in tests/snapshots"
+    )
+    parser.add_argument(
+        "--snapshots-dir",
+        type=Path,
+        default=DEFAULT_SNAPSHOT_DIR,
+        help="Snapshot root (default: tests/snapshots)",
+    )
+    parser.add_argument(
+        "--suppliers", help="Comma-separated config slugs to benchmark (default: all)"
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per supplier")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per supplier")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to check for regressions")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown/growth before flagging a regression (default: 0.20 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    suppliers = {s.strip() for s in args.suppliers.split(",")} if args.suppliers else None
+    cases = discover_cases(args.snapshots_dir, suppliers)
+    if not cases:
+        print("ERROR: No snapshot PDF matches a supplier config", file=sys.stderr)
+        sys.exit(1)
+
+    results = [bench_case(case, warmup=args.warmup, runs=args.runs) for case in cases]
+    print(format_results(results))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, threshold=args.threshold)
+        if regressions:
+            print("Regressions against baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regression beyond {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
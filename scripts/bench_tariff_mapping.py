@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session, selectinload  # noqa: E402
+
+from api.app.db import models  # noqa: E402
+from api.app.db.base import Base  # noqa: E402
+from api.app.db.repositories.tariffs import OBSERVATION_COLUMNS, TariffRepository  # noqa: E402
+from api.app.models.enums import TariffOption  # noqa: E402
+
+PUISSANCES = (3, 6, 9, 12, 15, 18, 24, 30, 36)
+
+
+def seed(session: Session, rows: int) -> None:
+    """Insert ``rows`` HPHC observations spread over a few suppliers and source URLs."""
+    suppliers = [models.Supplier(name=f"Supplier {index}") for index in range(4)]
+    session.add_all(suppliers)
+    session.flush()
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        models.Tariff(
+            supplier_id=suppliers[index % len(suppliers)].id,
+            option=TariffOption.HPHC,
+            puissance_kva=PUISSANCES[index % len(PUISSANCES)],
+            price_kwh_hp_ttc=0.2 + index / 1e6,
+            price_kwh_hc_ttc=0.15,
+            abo_month_ttc=12.5,
+            observed_at=now - timedelta(hours=index),
+            parser_version="bench_v1",
+            source_url=f"https://supplier{index % 8}.example.com/grille.pdf",
+            source_checksum=f"{index:064x}",
+        )
+        for index in range(rows)
+    )
+    session.commit()
+
+
+def _median_ms(fn: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(rows: int, runs: int) -> dict[str, float]:
+    """Median milliseconds to load and map ``rows`` observations, per read path."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    repo = TariffRepository(None)  # mapping helpers do not touch the session
+
+    with Session(engine) as session:
+        seed(session, rows)
+
+        def _orm() -> None:
+            # Previous read path: ORM objects + selectinload.
+            stmt = select(models.Tariff).options(selectinload(models.Tariff.supplier))
+            for tariff in session.execute(stmt).scalars():
+                row = [tariff.supplier.name]
+                row.extend(getattr(tariff, column.key) for column in OBSERVATION_COLUMNS[1:])
+                repo._to_observation(row)
+            session.expunge_all()
+
+        core_stmt = select(*OBSERVATION_COLUMNS).select_from(models.Tariff).join(models.Supplier)
+        core_rows = session.execute(core_stmt).all()
+
+        results = {
+            "orm_ms": _median_ms(_orm, runs),
+            "core_query_ms": _median_ms(lambda: session.execute(core_stmt).all(), runs),
+            "map_core_ms": _median_ms(lambda: repo._to_observations(core_rows, {}), runs),
+        }
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the ORM and Core-row tariff read paths")
+    parser.add_argument("--rows", type=int, default=1000, help="Observations to map")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per path")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.runs)
+    core = results["core_query_ms"] + results["map_core_ms"]
+    for name, value in results.items():
+        print(f"{name:<18} {value:>9.2f}")
+    print(f"{'core_total_ms':<18} {core:>9.2f}")
+    print(f"speedup vs ORM objects: {results['orm_ms'] / core:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from sqlalchemy import select
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api.app.core.config import settings  # noqa: E402
+from api.app.db import models  # noqa: E402
+from api.app.db.session import get_engine, get_session_factory  # noqa: E402
+from ingest.artifact_store import ArtifactStore  # noqa: E402
+
+
+async def referenced_checksums() -> set[str]:
+    """Checksums still referenced by persisted tariff observations."""
+    try:
+        async with get_session_factory()() as session:
+            result = await session.execute(select(models.Tariff.source_checksum).distinct())
+            return {row[0].strip() for row in result.all()}
+    finally:
+        await get_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Delete raw artifacts no longer referenced by tariffs.source_checksum"
+    )
+    parser.add_argument(
+        "--raw-dir",
+        default="artifacts/raw",
+        help="Content-addressed artifact store root (default: artifacts/raw)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would be deleted without deleting"
+    )
+    parser.add_argument(
+        "--no-keep-latest",
+        action="store_true",
+        help="Also delete the latest artifact of each source when no tariff references it",
+    )
+    args = parser.parse_args()
+
+    if not settings.enable_db:
+        parser.error("Set OPENWATT_ENABLE_DB=1 and OPENWATT_DATABASE_URL to read referenced blobs")
+
+    keep = asyncio.run(referenced_checksums())
+    store = ArtifactStore(Path(args.raw_dir))
+    report = store.gc(keep, keep_latest=not args.no_keep_latest, dry_run=args.dry_run)
+
+    action = "Would remove" if args.dry_run else "Removed"
+    print(
+        f"{action} {len(report.removed)} blob(s), {report.freed_bytes / 1024:.1f} KiB; "
+        f"kept {report.kept}."
+    )
+
+
+if __name__ == "__main__":
+    main()
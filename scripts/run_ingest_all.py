@@ -1,10 +1,31 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import asyncio
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api.app.core.config import settings  # noqa: E402
+from api.app.core.logging import configure_logging  # noqa: E402
+from api.app.core.sentry import configure_sentry  # noqa: E402
+from api.app.db.session import get_engine  # noqa: E402
+from ingest.fetch import DEFAULT_MAX_BYTES  # noqa: E402
+from ingest.parse_pool import DEFAULT_PARSE_TIMEOUT  # noqa: E402
+from ingest.orchestrator import (  # noqa: E402
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_PARSE_CONCURRENCY,
+    DEFAULT_PERSIST_CONCURRENCY,
+    IngestOrchestrator,
+    SupplierOutcome,
+    format_summary,
+)
+
 
 def detect_suppliers(config_dir: Path) -> list[str]:
     suppliers = []
@@ -13,19 +34,19 @@ def detect_suppliers(config_dir: Path) -> list[str]:
     return sorted(suppliers)
 
 
-def run_pipeline(supplier: str, observed_at: str | None) -> int:
-    cmd = [sys.executable, "-m", "ingest.pipeline", supplier, "--fetch", "--persist"]
-    if observed_at:
-        cmd.extend(["--observed-at", observed_at])
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    output = result.stdout + result.stderr
-    print(output)
-    return result.returncode
+async def run_all(
+    orchestrator: IngestOrchestrator, suppliers: list[str], observed_at: datetime
+) -> list[SupplierOutcome]:
+    try:
+        return await orchestrator.run(suppliers, observed_at=observed_at)
+    finally:
+        if orchestrator.persist:
+            await get_engine().dispose()
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Run ingest.pipeline for all suppliers sequentially"
+        description="Run the ingest pipeline for all suppliers in a single process"
     )
     parser.add_argument(
         "--suppliers",
@@ -34,6 +55,50 @@ def main() -> None:
     parser.add_argument(
         "--observed-at", help="Optional ISO timestamp override (e.g. 2025-02-15T00:00:00+00:00)"
     )
+    parser.add_argument(
+        "--no-persist",
+        action="store_true",
+        help="Fetch and parse only; skip database writes and ingest_runs logging",
+    )
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=DEFAULT_FETCH_CONCURRENCY,
+        help=f"Concurrent downloads (default: {DEFAULT_FETCH_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--parse-concurrency",
+        type=int,
+        default=DEFAULT_PARSE_CONCURRENCY,
+        help=f"Parse worker processes (default: {DEFAULT_PARSE_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--parse-timeout",
+        type=float,
+        default=DEFAULT_PARSE_TIMEOUT,
+        help=f"Seconds allowed to parse one artifact (default: {DEFAULT_PARSE_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--persist-concurrency",
+        type=int,
+        default=DEFAULT_PERSIST_CONCURRENCY,
+        help=f"Concurrent database writers (default: {DEFAULT_PERSIST_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--raw-dir",
+        help="Directory to store fetched raw artifacts (default: artifacts/raw)",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f"Abort downloads larger than this many bytes (default: {DEFAULT_MAX_BYTES})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download, parse and persist sources even if they have not changed",
+    )
     args = parser.parse_args()
 
     if args.suppliers:
@@ -45,15 +110,37 @@ def main() -> None:
         parser.error(
             "No suppliers found. Provide --suppliers or add YAML files under parsers/config/"
         )
+    persist = not args.no_persist
+    if persist and not settings.enable_db:
+        parser.error(
+            "Set OPENWATT_ENABLE_DB=1 and OPENWATT_DATABASE_URL to enable persistence "
+            "(or pass --no-persist)"
+        )
+
+    configure_logging()
+    configure_sentry()
+
+    observed = (
+        datetime.fromisoformat(args.observed_at) if args.observed_at else datetime.now(timezone.utc)
+    )
+    orchestrator = IngestOrchestrator(
+        persist=persist,
+        raw_dir=Path(args.raw_dir) if args.raw_dir else None,
+        fetch_concurrency=args.fetch_concurrency,
+        parse_concurrency=args.parse_concurrency,
+        persist_concurrency=args.persist_concurrency,
+        max_bytes=args.max_bytes,
+        parse_timeout=args.parse_timeout,
+        force=args.force,
+    )
 
     print(f"Running ingest pipeline for {len(suppliers)} suppliers...")
-    failures: list[str] = []
-    for supplier in suppliers:
-        print(f"\n=== {supplier} ===")
-        code = run_pipeline(supplier, args.observed_at)
-        if code != 0:
-            failures.append(supplier)
+    started = time.perf_counter()
+    outcomes = asyncio.run(run_all(orchestrator, suppliers, observed))
+    print()
+    print(format_summary(outcomes, wall_seconds=time.perf_counter() - started))
 
+    failures = [outcome.supplier for outcome in outcomes if not outcome.ok]
     if failures:
         print(f"\nCompleted with failures: {', '.join(failures)}")
         sys.exit(1)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from api.app.core import cache as cache_module
+from api.app.core.cache import VersionedCache
+
+
+def _sample(result: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "openwatt_cache_requests_total", {"cache": "test", "result": result}
+    )
+    return value or 0.0
+
+
+def test_versioned_cache_serves_hits_until_the_version_changes():
+    version = {"value": 1}
+    loads: list[str] = []
+
+    async def _version():
+        return version["value"]
+
+    def _loader(key: str):
+        async def _load():
+            loads.append(key)
+            return f"{key}-v{version['value']}"
+
+        return _load
+
+    async def _scenario():
+        cache = VersionedCache("test", version_loader=_version, version_interval=0)
+        hits, misses = _sample("hit"), _sample("miss")
+
+        assert await cache.get_or_load("a", _loader("a")) == "a-v1"
+        assert await cache.get_or_load("a", _loader("a")) == "a-v1"
+        assert loads == ["a"]
+        assert _sample("hit") == hits + 1 and _sample("miss") == misses + 1
+
+        first_seen = cache.version_changed_at
+        assert first_seen is not None
+
+        version["value"] = 2
+        assert await cache.get_or_load("a", _loader("a")) == "a-v2"
+        assert loads == ["a", "a"]
+        # Distinct HTTP dates (second precision) even for changes within one second.
+        assert cache.version_changed_at > first_seen
+
+    asyncio.run(_scenario())
+
+
+def test_versioned_cache_is_bounded_and_expires(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: clock["now"])
+
+    async def _version():
+        return 1
+
+    async def _scenario():
+        cache = VersionedCache("test", version_loader=_version, maxsize=2, ttl=10)
+        for key in ("a", "b", "c"):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, result=key))
+        assert len(cache) == 2
+
+        calls = []
+
+        async def _reload():
+            calls.append(1)
+            return "fresh"
+
+        assert await cache.get_or_load("c", _reload) == "c"
+        clock["now"] += 11
+        assert await cache.get_or_load("c", _reload) == "fresh"
+        assert calls == [1]
+
+    asyncio.run(_scenario())
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from api.app.models.compare import ConsumptionProfile
+from api.app.models.enums import FreshnessStatus, TariffOption
+from api.app.models.tariffs import TariffObservation
+from api.app.services.compare_service import annual_costs, rank_offers
+
+
+def _offer(supplier: str, option: TariffOption, abo: float, **prices) -> TariffObservation:
+    return TariffObservation(
+        supplier=supplier,
+        option=option,
+        puissance_kva=6,
+        abo_month_ttc=abo,
+        observed_at=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        parser_version="test_v1",
+        source_url=f"https://{supplier.lower()}.example.com/grille.pdf",
+        source_checksum="a" * 64,
+        data_status=FreshnessStatus.FRESH,
+        **prices,
+    )
+
+
+def _coalesce(*values):
+    """JavaScript ``??`` chain."""
+    return next(value for value in values if value is not None)
+
+
+def _ui_annual_cost(obs: TariffObservation, consumption: float, hc_share: float) -> float:
+    """Line-by-line port of computeAnnualCost (ui/components/TariffList.tsx)."""
+    abo = _coalesce(obs.abo_month_ttc, 0) * 12
+    if obs.option == TariffOption.HPHC:
+        hp_price = _coalesce(obs.price_kwh_hp_ttc, obs.price_kwh_ttc, 0)
+        hc_price = _coalesce(obs.price_kwh_hc_ttc, obs.price_kwh_ttc, hp_price)
+        return (
+            abo
+            + consumption * (1 - hc_share / 100) * hp_price
+            + consumption * (hc_share / 100) * hc_price
+        )
+    return abo + consumption * _coalesce(obs.price_kwh_ttc, obs.price_kwh_hp_ttc, 0)
+
+
+OFFERS = [
+    _offer("Base", TariffOption.BASE, 12.0, price_kwh_ttc=0.25),
+    _offer("Hphc", TariffOption.HPHC, 13.0, price_kwh_hp_ttc=0.27, price_kwh_hc_ttc=0.2),
+    _offer("HphcNoHc", TariffOption.HPHC, 13.0, price_kwh_ttc=0.24, price_kwh_hp_ttc=0.27),
+    _offer("HphcBaseOnly", TariffOption.HPHC, 11.0, price_kwh_ttc=0.26),
+    _offer("Tempo", TariffOption.TEMPO, 14.0, price_kwh_hp_ttc=0.22),
+    _offer("NoPrice", TariffOption.BASE, 10.0),
+]
+
+
+@pytest.mark.parametrize("consumption,hc_share", [(5000, 40), (2500, 0), (12000, 100)])
+def test_annual_costs_match_the_ui_formula(consumption, hc_share):
+    costs = annual_costs(OFFERS, consumption_kwh=consumption, hc_share=hc_share)
+    expected = [_ui_annual_cost(obs, consumption, hc_share) for obs in OFFERS]
+    assert costs.tolist() == pytest.approx(expected)
+
+
+def test_rank_offers_returns_top_n_cheapest_first():
+    profile = ConsumptionProfile(consumption_kwh=5000, hc_share=40)
+    response = rank_offers(OFFERS, profile, top=3)
+
+    assert response.total_offers == len(OFFERS)
+    assert [item.rank for item in response.items] == [1, 2, 3]
+    costs = [item.annual_cost_eur for item in response.items]
+    assert costs == sorted(costs)
+    assert response.items[0].offer.supplier == "NoPrice"
+    assert rank_offers([], profile, top=3).items == []
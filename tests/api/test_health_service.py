@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from prometheus_client import REGISTRY
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from api.app.db.base import Base
@@ -393,3 +394,42 @@ class TestHealthService:
         # Running status is not considered broken, but it's also not fresh/stale
         # so it should default to verifying
         assert supplier_health["data_status"] == "verifying"
+
+    @pytest.mark.asyncio
+    async def test_single_query_and_cached_report(self, session_factory):
+        """Stats for all suppliers come from one statement; repeated polls hit the cache."""
+        now = datetime.now(timezone.utc)
+
+        async with session_factory() as session:
+            session.add_all(
+                IngestRun(
+                    supplier=supplier,
+                    started_at=now - timedelta(hours=hours),
+                    finished_at=now - timedelta(hours=hours),
+                    status=status,
+                    rows_inserted=0,
+                )
+                for supplier in ("edf", "engie", "total_standard_fixe")
+                for hours, status in ((1, "failed"), (2, "unchanged"), (3, "success"))
+            )
+            await session.commit()
+
+        def _queries() -> float:
+            return (
+                REGISTRY.get_sample_value(
+                    "openwatt_db_queries_total", {"operation": "ingest_health"}
+                )
+                or 0.0
+            )
+
+        service = HealthService(session_factory=session_factory, cache_ttl=60)
+        before = _queries()
+        first = await service.get_ingest_health()
+        assert _queries() - before == 1
+        assert await service.get_ingest_health() is first
+        assert _queries() - before == 1
+
+        stats = find_supplier(first["suppliers"], "engie")
+        assert stats["consecutive_failures"] == 1
+        assert stats["last_run_status"] == "failed"
+        assert stats["last_success_at"] is not None
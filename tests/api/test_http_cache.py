@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from api.app.core.http_cache import Validators, is_not_modified, make_etag
+
+
+def test_etag_is_strong_and_depends_on_every_part():
+    etag = make_etag((12, "2025-02-12"), "latest", "BASE")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag((12, "2025-02-12"), "latest", "BASE")
+    assert etag != make_etag((13, "2025-02-12"), "latest", "BASE")
+    assert etag != make_etag((12, "2025-02-12"), "latest", "HPHC")
+
+
+def test_conditional_headers_follow_rfc_precedence():
+    validators = Validators(
+        etag='"abc"', last_modified=datetime(2025, 2, 12, 8, 0, 30, 500, tzinfo=timezone.utc)
+    )
+    last_modified = validators.headers(60)["Last-Modified"]
+    assert last_modified == "Wed, 12 Feb 2025 08:00:30 GMT"
+
+    assert is_not_modified({"if-none-match": '"abc"'}, validators)
+    assert is_not_modified({"if-none-match": 'W/"old", W/"abc"'}, validators)
+    assert is_not_modified({"if-none-match": "*"}, validators)
+    assert is_not_modified({"if-modified-since": last_modified}, validators)
+    assert not is_not_modified({"if-modified-since": "Wed, 12 Feb 2025 08:00:29 GMT"}, validators)
+    assert not is_not_modified({"if-modified-since": "not a date"}, validators)
+    # A non-matching entity tag wins over a matching date.
+    assert not is_not_modified(
+        {"if-none-match": '"old"', "if-modified-since": last_modified}, validators
+    )
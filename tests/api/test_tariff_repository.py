@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import warnings
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from api.app.db import models
+from api.app.db.base import Base
+from api.app.db.repositories.tariffs import OBSERVATION_COLUMNS, TariffRepository
+from api.app.models.tariffs import TariffObservation
+from scripts.bench_tariff_mapping import seed
+
+
+def test_core_rows_map_to_observations():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, 400)  # one row per hour: the oldest are over 14 days old
+        session.execute(
+            models.Tariff.__table__.update()
+            .where(models.Tariff.id % 7 == 0)
+            .values(notes="validation pending", price_kwh_ttc=0.21)
+        )
+        stmt = select(*OBSERVATION_COLUMNS).select_from(models.Tariff).join(models.Supplier)
+        rows = session.execute(stmt).all()
+    engine.dispose()
+
+    repo = TariffRepository(None)
+    now = datetime.now(timezone.utc)
+    statuses = set()
+    for row in rows:
+        observation = repo._to_observation(row, now=now)
+        assert observation.source_url.host.endswith(".example.com")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            dumped = observation.model_dump_json()
+        assert TariffObservation.model_validate_json(dumped) == observation
+        statuses.add(observation.data_status)
+    assert len(statuses) == 3  # fresh, verifying and stale rows were all mapped
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from pathlib import Path
+
+from ingest.artifact_store import ArtifactStore
+
+URL = "https://example.com/grille.pdf"
+
+
+def test_identical_artifacts_are_stored_once(tmp_path: Path):
+    store = ArtifactStore(tmp_path)
+    fetched_at = datetime(2025, 2, 12, 8, tzinfo=timezone.utc)
+
+    first_path, checksum = store.put_bytes(
+        b"grid v1", supplier="edf", source_url=URL, fetched_at=fetched_at
+    )
+    second_path, second_checksum = store.put_bytes(
+        b"grid v1", supplier="edf", source_url=URL, fetched_at=fetched_at + timedelta(days=1)
+    )
+
+    assert checksum == second_checksum == sha256(b"grid v1").hexdigest()
+    assert first_path == second_path == store.blob_path(checksum)
+    assert first_path.relative_to(tmp_path).parts[:3] == ("objects", checksum[:2], checksum[2:4])
+    assert [p for p in (tmp_path / "objects").rglob("*") if p.is_file()] == [first_path]
+    assert store.find(checksum) == first_path
+    assert store.lookup("edf", fetched_at) == checksum
+    assert store.lookup("edf", fetched_at + timedelta(days=2)) is None
+
+
+def test_gc_keeps_referenced_and_latest_blobs(tmp_path: Path):
+    store = ArtifactStore(tmp_path)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    _, old = store.put_bytes(b"old", supplier="edf", source_url=URL, fetched_at=base)
+    _, referenced = store.put_bytes(
+        b"referenced", supplier="edf", source_url=URL, fetched_at=base + timedelta(days=1)
+    )
+    _, latest = store.put_bytes(
+        b"latest", supplier="edf", source_url=URL, fetched_at=base + timedelta(days=2)
+    )
+
+    dry = store.gc({referenced}, dry_run=True)
+    assert dry.removed == [old]
+    assert store.find(old) is not None
+
+    report = store.gc({referenced})
+    assert report.removed == [old]
+    assert report.freed_bytes == len(b"old")
+    assert store.find(old) is None
+    assert store.find(referenced) and store.find(latest)
+    assert {entry.checksum for entry in store.entries()} == {referenced, latest}
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from ingest.artifact_store import ArtifactTooLargeError
+from ingest.fetch import FetchMetadataStore, fetch_supplier_artifact
+from parsers.core.config import PdfConfig, SourceConfig, SupplierConfig
+
+PDF_BYTES = b"%PDF-1.7 fake tariff grid"
+
+
+def _config() -> SupplierConfig:
+    return SupplierConfig(
+        supplier="TestCo",
+        parser_version="test_v1",
+        source=SourceConfig(url="https://example.com/grille.pdf", format="pdf"),
+        pdf=PdfConfig(tables=[]),
+    )
+
+
+def _response(status_code: int = 200, headers: dict | None = None, content: bytes = b""):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = headers or {}
+    response.iter_content = Mock(
+        side_effect=lambda chunk_size: (
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        )
+    )
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestConditionalFetch:
+    def test_first_fetch_downloads_and_records_validators(self, tmp_path: Path):
+        session = Mock()
+        session.get.return_value = _response(
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 03 Feb 2025 08:00:00 GMT"},
+            content=PDF_BYTES,
+        )
+        store = FetchMetadataStore(tmp_path / "meta")
+
+        result = fetch_supplier_artifact(
+            _config(), raw_dir=tmp_path, session=session, metadata_store=store
+        )
+
+        assert result.status == "fetched"
+        assert result.checksum == sha256(PDF_BYTES).hexdigest()
+        assert result.path.read_bytes() == PDF_BYTES
+        assert session.get.call_args.kwargs["headers"] == {}
+        assert result.validators.etag == '"v1"'
+        assert result.validators.content_length == len(PDF_BYTES)
+
+    def test_304_returns_unchanged_without_writing(self, tmp_path: Path):
+        store = FetchMetadataStore(tmp_path / "meta")
+        session = Mock()
+        session.get.return_value = _response(headers={"ETag": '"v1"'}, content=PDF_BYTES)
+        first = fetch_supplier_artifact(
+            _config(), raw_dir=tmp_path, session=session, metadata_store=store
+        )
+        store.save(_config(), first.validators)
+
+        session.get.return_value = _response(status_code=304)
+        result = fetch_supplier_artifact(
+            _config(), raw_dir=tmp_path, session=session, metadata_store=store
+        )
+
+        assert result.unchanged
+        assert result.checksum == first.checksum
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert len([path for path in (tmp_path / "objects").rglob("*") if path.is_file()]) == 1
+
+    def test_sources_without_validators_are_always_downloaded(self, tmp_path: Path):
+        store = FetchMetadataStore(tmp_path / "meta")
+        session = Mock()
+        session.get.return_value = _response(content=PDF_BYTES)
+        first = fetch_supplier_artifact(
+            _config(), raw_dir=tmp_path, session=session, metadata_store=store
+        )
+        store.save(_config(), first.validators)
+
+        # Same size, different bytes: Content-Length alone must not mark it unchanged.
+        session.get.return_value = _response(
+            headers={"Content-Length": str(len(PDF_BYTES))}, content=PDF_BYTES[::-1]
+        )
+        result = fetch_supplier_artifact(
+            _config(), raw_dir=tmp_path, session=session, metadata_store=store
+        )
+        assert result.status == "fetched"
+        assert result.checksum == sha256(PDF_BYTES[::-1]).hexdigest()
+        assert session.get.call_args.kwargs["headers"] == {}
+        session.head.assert_not_called()
+
+
+class TestStreamingFetch:
+    def test_body_is_streamed_in_chunks(self, tmp_path: Path):
+        body = b"x" * (200 * 1024)
+        session = Mock()
+        session.get.return_value = _response(content=body)
+
+        result = fetch_supplier_artifact(_config(), raw_dir=tmp_path, session=session)
+
+        assert session.get.call_args.kwargs["stream"] is True
+        assert result.checksum == sha256(body).hexdigest()
+        assert result.path.read_bytes() == body
+        assert result.validators.content_length == len(body)
+
+    def test_announced_oversized_response_is_rejected_before_download(self, tmp_path: Path):
+        session = Mock()
+        response = _response(headers={"Content-Length": "2048"}, content=b"x" * 2048)
+        session.get.return_value = response
+
+        with pytest.raises(ArtifactTooLargeError):
+            fetch_supplier_artifact(_config(), raw_dir=tmp_path, session=session, max_bytes=1024)
+        response.iter_content.assert_not_called()
+
+    def test_runaway_body_is_aborted_and_discarded(self, tmp_path: Path):
+        session = Mock()
+        session.get.return_value = _response(content=b"x" * (300 * 1024))
+
+        with pytest.raises(ArtifactTooLargeError):
+            fetch_supplier_artifact(
+                _config(), raw_dir=tmp_path, session=session, max_bytes=100 * 1024
+            )
+        assert [path for path in (tmp_path / "objects").rglob("*") if path.is_file()] == []
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.app.db.base import Base
+from api.app.db.models import IngestRun, Tariff
+from ingest import orchestrator as orchestrator_module
+from ingest.fetch import FetchMetadataStore, FetchResult
+from ingest.orchestrator import IngestOrchestrator, format_summary
+
+SNAPSHOT_ROOT = Path(__file__).parent.parent / "snapshots"
+SNAPSHOTS = {
+    "EDF": SNAPSHOT_ROOT / "edf" / "edf_tarif_bleu.pdf",
+    "Engie": SNAPSHOT_ROOT / "engie" / "engie_reference.pdf",
+}
+
+
+def _fake_fetch(config, raw_dir=None, timeout=60, **kwargs):
+    if config.supplier not in SNAPSHOTS:
+        raise RuntimeError(f"source unavailable for {config.supplier}")
+    path = SNAPSHOTS[config.supplier]
+    return FetchResult(status="fetched", path=path, checksum=sha256(path.read_bytes()).hexdigest())
+
+
+def test_orchestrator_runs_suppliers_in_process(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(orchestrator_module, "fetch_supplier_artifact", _fake_fetch)
+    asyncio.run(_run_orchestrator(tmp_path))
+
+
+async def _run_orchestrator(tmp_path: Path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'ingest.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    orchestrator = IngestOrchestrator(
+        parsed_dir=tmp_path / "parsed",
+        metadata_store=FetchMetadataStore(tmp_path / "fetch_meta"),
+        session_factory=session_factory,
+        fetch_concurrency=2,
+        parse_concurrency=2,
+        persist_concurrency=1,
+    )
+    outcomes = await orchestrator.run(
+        ["edf", "engie", "total_heures_eco"],
+        observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+    )
+
+    assert [outcome.supplier for outcome in outcomes] == ["edf", "engie", "total_heures_eco"]
+    edf, engie, total = outcomes
+    assert edf.ok and engie.ok
+    assert edf.rows_inserted == edf.rows_parsed > 0
+    assert engie.rows_inserted == engie.rows_parsed > 0
+    assert total.status == "failed" and "source unavailable" in total.error
+    assert len(list((tmp_path / "parsed").glob("*.json"))) == 2
+    assert len(list((tmp_path / "fetch_meta").glob("*.json"))) == 2
+
+    async with session_factory() as session:
+        runs = (await session.execute(select(IngestRun))).scalars().all()
+        tariff_count = len((await session.execute(select(Tariff.id))).all())
+    assert sorted(run.status for run in runs) == ["failed", "success", "success"]
+    assert tariff_count == edf.rows_inserted + engie.rows_inserted
+
+    summary = format_summary(outcomes, wall_seconds=1.0)
+    assert "edf" in summary and "total_heures_eco" in summary
+    assert "source unavailable" in summary
+
+    await engine.dispose()
+
+
+def test_orchestrator_skips_sources_matching_last_successful_checksum(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(orchestrator_module, "fetch_supplier_artifact", _fake_fetch)
+    asyncio.run(_run_twice(tmp_path))
+
+
+async def _run_twice(tmp_path: Path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'ingest.db').as_posix()}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    def _orchestrator(force: bool = False) -> IngestOrchestrator:
+        return IngestOrchestrator(
+            parsed_dir=tmp_path / "parsed",
+            metadata_store=FetchMetadataStore(tmp_path / "fetch_meta"),
+            session_factory=session_factory,
+            parse_concurrency=1,
+            force=force,
+        )
+
+    observed_at = datetime.fromisoformat("2025-02-12T08:00:00+00:00")
+    (first,) = await _orchestrator().run(["edf"], observed_at=observed_at)
+    (second,) = await _orchestrator().run(["edf"], observed_at=observed_at)
+    (forced,) = await _orchestrator(force=True).run(["edf"], observed_at=observed_at)
+
+    assert first.status == "success" and first.rows_inserted > 0
+    assert second.status == "unchanged"
+    assert second.rows_parsed == 0 and second.parse_seconds == 0
+    assert forced.status == "success" and forced.rows_parsed == first.rows_parsed
+    assert forced.rows_inserted == 0
+
+    async with session_factory() as session:
+        statuses = (
+            (await session.execute(select(IngestRun.status).order_by(IngestRun.id))).scalars().all()
+        )
+    assert statuses == ["success", "unchanged", "success"]
+    await engine.dispose()
+
+
+def test_dry_run_does_not_save_fetch_validators(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(orchestrator_module, "fetch_supplier_artifact", _fake_fetch)
+    meta_dir = tmp_path / "fetch_meta"
+    orchestrator = IngestOrchestrator(
+        persist=False,
+        parsed_dir=tmp_path / "parsed",
+        metadata_store=FetchMetadataStore(meta_dir),
+        parse_concurrency=1,
+    )
+    (outcome,) = asyncio.run(
+        orchestrator.run(["edf"], observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"))
+    )
+
+    assert outcome.status == "success" and outcome.rows_parsed > 0
+    # Otherwise the next persisted run would get a 304 and never write the rows.
+    assert not meta_dir.exists() or not any(meta_dir.iterdir())
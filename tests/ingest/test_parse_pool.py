@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+from ingest.parse_pool import ParseJob, ParsePool
+from parsers.core import parser as yaml_parser
+from parsers.core.config import load_supplier_config
+
+SNAPSHOT_ROOT = Path(__file__).parent.parent / "snapshots"
+OBSERVED_AT = datetime.fromisoformat("2025-02-12T08:00:00+00:00")
+
+
+def _job(supplier: str, relative_path: str) -> ParseJob:
+    path = SNAPSHOT_ROOT / relative_path
+    return ParseJob(
+        config=load_supplier_config(supplier),
+        artifact_path=path,
+        observed_at=OBSERVED_AT,
+        source_checksum=sha256(path.read_bytes()).hexdigest() if path.exists() else "0" * 64,
+    )
+
+
+def test_parse_pool_returns_results_in_submission_order():
+    jobs = [
+        _job("engie", "engie/engie_reference.pdf"),
+        _job("edf", "missing/edf.pdf"),
+        _job("edf", "edf/edf_tarif_bleu.pdf"),
+    ]
+    with ParsePool(max_workers=2, timeout=60) as pool:
+        # Never fork the caller: its other threads may hold locks the child would inherit.
+        assert pool._context.get_start_method() in ("forkserver", "spawn")
+        results = pool.map(jobs)
+
+    assert [result.job for result in results] == jobs
+    engie, missing, edf = results
+    assert not missing.ok and "missing" in missing.error
+    for result in (engie, edf):
+        assert result.ok
+        assert result.batch.to_records() == yaml_parser.parse_file(
+            result.job.config,
+            result.job.artifact_path,
+            observed_at=OBSERVED_AT,
+            source_checksum=result.job.source_checksum,
+        )
+
+
+# Parse hooks run in the worker processes, which import them from this module by name.
+def _slow_parse(config, artifact_path, **kwargs):
+    time.sleep(30)
+
+
+def _slow_edf_parse(config, artifact_path, **kwargs):
+    if config.supplier == "EDF":
+        time.sleep(30)
+    return yaml_parser.parse_file_batch(config, artifact_path, **kwargs)
+
+
+def test_parse_pool_times_out_a_stuck_job():
+    started = time.monotonic()
+    with ParsePool(max_workers=1, timeout=0.5, parse_fn=_slow_parse) as pool:
+        (result,) = pool.map([_job("edf", "edf/edf_tarif_bleu.pdf")])
+    assert not result.ok and "timed out" in result.error
+    assert time.monotonic() - started < 10
+
+
+def test_parse_pool_timeout_does_not_spill_onto_queued_jobs():
+    # One worker: the healthy job waits behind the stuck one. Its timeout must count from
+    # its own start, and the stuck process must be stopped to free the slot.
+    started = time.monotonic()
+    with ParsePool(max_workers=1, timeout=5, parse_fn=_slow_edf_parse) as pool:
+        stuck, healthy = pool.map(
+            [_job("edf", "edf/edf_tarif_bleu.pdf"), _job("engie", "engie/engie_reference.pdf")]
+        )
+    assert not stuck.ok and "timed out" in stuck.error
+    assert healthy.ok and len(healthy.batch) > 0
+    assert time.monotonic() - started < 20
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.app.db.base import Base
+from ingest.persist import TariffPersister
+from ingest.pipeline import read_payload, write_payload
+from parsers.core.config import load_supplier_config
+from parsers.core.parser import parse_file_batch
+
+OBSERVED_AT = datetime.fromisoformat("2025-02-12T08:00:00+00:00")
+ARTIFACT = Path("tests/snapshots/edf/edf_tarif_bleu.pdf")
+
+
+@pytest.fixture
+def batch():
+    return parse_file_batch(
+        load_supplier_config("edf"),
+        ARTIFACT,
+        observed_at=OBSERVED_AT,
+        source_checksum=sha256(ARTIFACT.read_bytes()).hexdigest(),
+    )
+
+
+def test_json_output_is_an_indented_array(tmp_path: Path, batch):
+    path = write_payload(batch, supplier="edf", observed_at=OBSERVED_AT, parsed_dir=tmp_path)
+    assert path.name == "edf_20250212T080000Z.json"
+    expected = json.dumps(batch.to_records(), indent=2, ensure_ascii=False) + "\n"
+    assert path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_ndjson_output_round_trips_into_a_batch(tmp_path: Path, batch, compress: bool):
+    path = write_payload(
+        batch,
+        supplier="edf",
+        observed_at=OBSERVED_AT,
+        parsed_dir=tmp_path,
+        output_format="ndjson",
+        compress=compress,
+    )
+
+    assert path.name.endswith(".ndjson.gz" if compress else ".ndjson")
+    raw = gzip.decompress(path.read_bytes()) if compress else path.read_bytes()
+    assert len(raw.splitlines()) == len(batch)
+    assert read_payload(path) == batch
+
+
+def test_ndjson_payload_feeds_the_persister(tmp_path: Path, batch):
+    path = write_payload(
+        batch, supplier="edf", observed_at=OBSERVED_AT, parsed_dir=tmp_path, output_format="ndjson"
+    )
+
+    async def _persist() -> int:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        persister = TariffPersister(async_sessionmaker(engine, expire_on_commit=False))
+        try:
+            return await persister.persist(load_supplier_config("edf"), read_payload(path))
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(_persist()) == len(batch)
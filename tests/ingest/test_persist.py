@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from api.app.db.base import Base
+from api.app.db.models import Tariff
 from ingest.persist import TariffPersister
-from parsers.core.config import SelectorConfig, SourceConfig, SupplierConfig
+from parsers.core.config import (
+    SelectorConfig,
+    SourceConfig,
+    SupplierConfig,
+    load_supplier_config,
+)
+from parsers.core.parser import parse_file_batch
 
 
 def test_tariff_persister_inserts_and_skips_duplicates():
@@ -49,3 +62,86 @@ async def _run_persist_test():
 
     second_run = await persister.persist(config, rows)
     assert second_run == 0
+
+
+def test_tariff_persister_bulk_insert_is_idempotent(monkeypatch):
+    import asyncio
+
+    from ingest import persist as persist_module
+
+    # Force several INSERT chunks with a small batch.
+    monkeypatch.setattr(persist_module, "BULK_INSERT_CHUNK_SIZE", 100)
+    asyncio.run(_run_bulk_persist_test())
+
+
+async def _run_bulk_persist_test():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    config = SupplierConfig(
+        supplier="TestCo",
+        parser_version="test_v1",
+        source=SourceConfig(url="https://example.com", format="html"),
+        selectors=SelectorConfig(rows="article"),
+    )
+    rows = [
+        {
+            "supplier": "TestCo",
+            "option": "HPHC",
+            "puissance_kva": puissance,
+            "abo_month_ttc": 10.0 + day,
+            "price_kwh_hp_ttc": 0.2,
+            "price_kwh_hc_ttc": 0.15,
+            "observed_at": f"2025-02-{day:02d}T08:00:00Z",
+            "parser_version": "test_v1",
+            "source_url": "https://example.com/tarifs",
+            "source_checksum": "f" * 64,
+        }
+        for day in range(1, 29)
+        for puissance in (3, 6, 9, 12, 15, 18, 24, 30, 36)
+    ]
+
+    persister = TariffPersister(session_factory=session_factory)
+    assert await persister.persist(config, rows) == len(rows)
+    # A partially overlapping batch only inserts the new observation.
+    extra = dict(rows[0], observed_at="2025-03-01T08:00:00Z")
+    assert await persister.persist(config, rows + [extra]) == 1
+    await engine.dispose()
+
+
+def test_tariff_persister_accepts_columnar_batches():
+    import asyncio
+
+    asyncio.run(_run_batch_persist_test())
+
+
+async def _run_batch_persist_test():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    config = load_supplier_config("edf")
+    artifact = Path("tests/snapshots/edf/edf_tarif_bleu.pdf")
+    batch = parse_file_batch(
+        config,
+        artifact,
+        observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        source_checksum=sha256(artifact.read_bytes()).hexdigest(),
+    )
+
+    persister = TariffPersister(session_factory=session_factory)
+    assert await persister.persist(config, batch) == len(batch)
+    assert await persister.persist(config, batch) == 0
+    async with session_factory() as session:
+        hphc = await session.scalar(
+            select(func.count()).select_from(Tariff).where(Tariff.option == "HPHC")
+        )
+    assert hphc == batch.option.count("HPHC")
+
+    batch.puissance_kva[0] = 7
+    with pytest.raises(ValueError, match="puissance_kva"):
+        await persister.persist(config, batch)
+    await engine.dispose()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from ingest.rate_limiter import AsyncRateLimiter
+from parsers.core.config import load_supplier_config
+
+
+def test_async_limiter_throttles_per_domain_only():
+    async def _run():
+        limiter = AsyncRateLimiter(requests_per_second=10, burst_size=1)
+        started = time.monotonic()
+        await asyncio.gather(
+            limiter.acquire("https://a.example/1.pdf"),
+            limiter.acquire("https://a.example/2.pdf"),
+            limiter.acquire("https://b.example/1.pdf"),
+        )
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(_run())
+    # Two requests on a.example need one refill (~0.1s); b.example is not delayed by it.
+    assert 0.08 <= elapsed < 0.3
+
+
+def test_async_limiter_serves_waiters_in_arrival_order():
+    async def _run():
+        limiter = AsyncRateLimiter(requests_per_second=50, burst_size=1)
+        order: list[int] = []
+
+        async def _request(index: int) -> None:
+            await limiter.acquire("https://a.example/grid.pdf")
+            order.append(index)
+
+        await asyncio.gather(*(_request(index) for index in range(5)))
+        return order
+
+    assert asyncio.run(_run()) == [0, 1, 2, 3, 4]
+
+
+def test_async_limiter_uses_strictest_source_config():
+    limiter = AsyncRateLimiter(requests_per_second=1.0, burst_size=3)
+    limiter.configure("https://a.example/x.pdf", requests_per_second=0.5, burst_size=2)
+    limiter.configure("a.example", requests_per_second=2.0, burst_size=1)
+    assert limiter._limit("a.example") == (0.5, 1)
+    assert limiter._limit("b.example") == (1.0, 3)
+
+    config = load_supplier_config("edf")
+    limiter.configure_source(config)
+    assert limiter._limit("particulier.edf.fr") == (
+        config.source.rate_limit.requests_per_second,
+        config.source.rate_limit.burst_size,
+    )
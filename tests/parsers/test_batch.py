@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from parsers.core.batch import TariffBatch
+
+METADATA = {
+    "supplier": "TestCo",
+    "parser_version": "test_v1",
+    "source_url": "https://example.com/grille.pdf",
+    "source_checksum": "f" * 64,
+    "observed_at": "2025-02-12T08:00:00Z",
+    "data_status": "fresh",
+}
+
+
+def test_batch_stores_metadata_once_and_rebuilds_records():
+    records = [
+        {
+            **METADATA,
+            "option": "BASE",
+            "puissance_kva": 6,
+            "abo_month_ttc": 12.5,
+            "price_kwh_ttc": 0.2,
+        },
+        {
+            **METADATA,
+            "option": "HPHC",
+            "puissance_kva": 9,
+            "abo_month_ttc": 15.0,
+            "price_kwh_hp_ttc": 0.22,
+            "price_kwh_hc_ttc": 0.18,
+        },
+    ]
+
+    batch = TariffBatch.from_records(records)
+
+    assert len(batch) == 2
+    assert batch.metadata() == METADATA
+    assert batch.puissance_kva == [6, 9]
+    assert batch.price_kwh_ttc == [0.2, None]
+    assert batch.to_records() == records
+    assert list(batch) == records
+
+
+def test_extra_fields_become_sparse_columns():
+    batch = TariffBatch(**METADATA)
+    batch.append(option="BASE", puissance_kva=6, abo_month_ttc=1.0)
+    batch.append(option="BASE", puissance_kva=9, abo_month_ttc=2.0, label="Eco")
+
+    assert batch.extras == {"label": [None, "Eco"]}
+    assert [row.get("label") for row in batch.iter_rows()] == [None, "Eco"]
+
+
+def test_rows_with_different_metadata_are_rejected():
+    first = {**METADATA, "option": "BASE", "puissance_kva": 6}
+    second = {**first, "observed_at": "2025-03-01T08:00:00Z"}
+    with pytest.raises(ValueError):
+        TariffBatch.from_records([first, second])
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from parsers.core.config import SupplierConfigRegistry
+
+CONFIG = """
+supplier: TestCo
+parser_version: {version}
+source:
+  url: https://example.com/grille.pdf
+  format: pdf
+pdf:
+  tables: []
+"""
+
+
+def _write(path: Path, version: str, mtime_ns: int | None = None) -> None:
+    path.write_text(CONFIG.format(version=version), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_configs_are_cached_until_the_file_changes(tmp_path: Path):
+    config_path = tmp_path / "testco.yaml"
+    _write(config_path, "v1", mtime_ns=1_000_000_000)
+    registry = SupplierConfigRegistry(tmp_path, check_interval=0)
+
+    first = registry.get("TestCo")
+    assert registry.get("testco") is first
+    assert registry.slugs() == ["testco"]
+
+    # Same content with a new mtime: re-hashed but not re-validated.
+    os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+    assert registry.get("testco") is first
+
+    _write(config_path, "v2", mtime_ns=3_000_000_000)
+    assert registry.get("testco").parser_version == "v2"
+
+
+def test_throttled_registry_skips_rescans_but_finds_new_files(tmp_path: Path):
+    _write(tmp_path / "a.yaml", "v1")
+    registry = SupplierConfigRegistry(tmp_path, check_interval=3600)
+    assert registry.slugs() == ["a"]
+
+    _write(tmp_path / "a.yaml", "v2-longer")
+    assert registry.get("a").parser_version == "v1"
+
+    _write(tmp_path / "b.yaml", "v1")
+    assert registry.get("b").parser_version == "v1"
+    assert registry.slugs() == ["a", "b"]
+
+    with pytest.raises(FileNotFoundError):
+        registry.get("missing")
+
+
+def test_invalid_config_only_fails_its_own_lookup(tmp_path: Path):
+    _write(tmp_path / "good.yaml", "v1")
+    (tmp_path / "bad.yaml").write_text("supplier: Bad\n", encoding="utf-8")
+    registry = SupplierConfigRegistry(tmp_path, check_interval=0)
+
+    assert registry.slugs() == ["bad", "good"]
+    assert registry.get("good").parser_version == "v1"
+    with pytest.raises(ValueError):
+        registry.get("bad")
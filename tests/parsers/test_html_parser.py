@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from parsers.core.config import SelectorConfig, SourceConfig, SupplierConfig
+from parsers.core.parser import YamlTariffParser
+
+HTML = """
+<html><body>
+  <nav><div class="offer" data-option="base"><span class="kva">99</span></div></nav>
+  <section id="grille" class="tarifs">
+    <div class="offer" data-option="base">
+      <span class="kva">6</span><span class="abo">15.50</span><span class="kwh">0.2516</span>
+    </div>
+    <div class="offer" data-option="base">
+      <span class="kva">9</span><span class="abo">19.2</span><span class="kwh">0.2516</span>
+    </div>
+  </section>
+</body></html>
+"""
+
+
+def _config(**selector_options) -> SupplierConfig:
+    return SupplierConfig(
+        supplier="TestCo",
+        parser_version="test_html_v1",
+        source=SourceConfig(url="https://example.com/tarifs", format="html"),
+        selectors=SelectorConfig(
+            rows="div.offer",
+            fields={
+                "puissance_kva": "span.kva",
+                "abo_month_ttc": "span.abo",
+                "price_kwh_ttc": "span.kwh",
+                "option": "@data-option",
+            },
+            **selector_options,
+        ),
+    )
+
+
+def _parse(config: SupplierConfig):
+    return YamlTariffParser(config).parse_html(
+        HTML,
+        observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        source_checksum="0" * 64,
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"engine": "lxml", "container": "section.tarifs"},
+        {"engine": "lxml", "container": "#grille"},
+        {"engine": "html.parser", "container": "body > section"},
+    ],
+)
+def test_container_restricts_rows_with_any_engine(options):
+    rows = _parse(_config(**options))
+    assert [row["puissance_kva"] for row in rows] == [6, 9]
+    assert rows[0]["abo_month_ttc"] == 15.5
+    assert rows[0]["option"] == "BASE"
+
+
+def test_lxml_engine_matches_default_parser():
+    assert _parse(_config(engine="lxml")) == _parse(_config())
+    assert len(_parse(_config())) == 3
+
+
+def test_missing_container_yields_no_rows():
+    assert _parse(_config(engine="lxml", container="table.absent")) == []
+    assert _parse(_config(container="main > table")) == []
+
+
+GRIDS_HTML = """
+<html><body>
+  <section id="offers">
+    <div class="grid"><div class="offer"><span class="kva">6</span></div></div>
+  </section>
+  <div class="grid"><div class="offer"><span class="kva">9</span></div></div>
+</body></html>
+"""
+
+
+def _grid_kvas(container: str, rows: str = "div.offer") -> list[int]:
+    config = SupplierConfig(
+        supplier="TestCo",
+        parser_version="test_html_v1",
+        source=SourceConfig(url="https://example.com/tarifs", format="html"),
+        selectors=SelectorConfig(
+            rows=rows, fields={"puissance_kva": "span.kva"}, container=container
+        ),
+    )
+    batch = YamlTariffParser(config).parse_html(
+        GRIDS_HTML,
+        observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        source_checksum="0" * 64,
+    )
+    return [row["puissance_kva"] for row in batch]
+
+
+def test_strainer_and_full_parse_containers_agree():
+    # "div.grid" is parsed through a SoupStrainer, "body div.grid" through the full tree:
+    # both keep the first grid only, and rows cannot reach the container's ancestors.
+    assert _grid_kvas("div.grid") == _grid_kvas("body div.grid") == [6]
+    assert _grid_kvas("div.grid", rows="#offers div.offer") == []
+    assert _grid_kvas("body div.grid", rows="#offers div.offer") == []
+    assert _grid_kvas(None, rows="#offers div.offer") == [6]
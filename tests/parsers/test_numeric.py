@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import math
+import re
+
+import numpy as np
+
+from parsers.core import numeric
+
+CELLS = [
+    "12,34 €",
+    "19.52 cts",
+    "0,2516\n€ TTC",
+    "-",
+    "--",
+    "",
+    None,
+    "  ",
+    "25 %",
+    "1.2.3",
+    "+",
+    "-3,5",
+    "Cts 7",
+    "6 kVA",
+]
+
+
+def _legacy_parse_float(value):
+    """parse_float as it was before the numeric module (chained replaces + re.sub)."""
+    text = "" if value is None else str(value).replace("\n", " ").strip()
+    if not text:
+        return None
+    text = text.replace("€", "").replace("cts", "").replace("Cts", "").replace("%", "")
+    text = text.replace(",", ".")
+    text = re.sub(r"[^0-9.+-]", "", text)
+    if not text or text in {"-", "--"}:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def test_scalar_and_column_parsing_match_legacy_behaviour():
+    expected = [_legacy_parse_float(cell) for cell in CELLS]
+    assert [numeric.parse_float(cell) for cell in CELLS] == expected
+
+    column = numeric.parse_float_column(CELLS)
+    assert column.dtype == np.float64
+    for value, legacy in zip(column.tolist(), expected):
+        assert (legacy is None and math.isnan(value)) or value == legacy
+
+
+def test_ragged_table_is_padded_with_nan():
+    table = numeric.parse_float_table([["6", "12,5 €"], ["9"], []])
+    assert table.shape == (3, 2)
+    assert table[0].tolist() == [6.0, 12.5]
+    assert table[1, 0] == 9.0 and math.isnan(table[1, 1])
+    assert np.isnan(table[2]).all()
+    assert numeric.parse_float_table([]).shape == (0, 0)
+
+
+def test_parse_int_takes_first_digit_run():
+    assert numeric.parse_int("6 kVA") == 6
+    assert numeric.parse_int("36\nkVA") == 36
+    assert numeric.parse_int("—") is None
+    assert numeric.parse_int(None) is None
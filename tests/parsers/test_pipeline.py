@@ -7,8 +7,9 @@ from pathlib import Path
 
 import pytest
 
-from parsers.core.config import load_supplier_config
+from parsers.core.config import PdfTableConfig, load_supplier_config
 from parsers.core import parser as core_parser
+from parsers.core.pdf_parser import PdfParseStats, parse_pdf
 
 SNAPSHOT_ROOT = Path(__file__).parent.parent / "snapshots"
 
@@ -46,3 +47,71 @@ def test_parser_matches_expected_snapshot(supplier: str, artifact_rel: str, expe
     rows = run_snapshot(supplier, artifact_path, observed_at)
     expected = json.loads(expected_path.read_text(encoding="utf-8"))
     assert rows == expected
+
+
+@pytest.mark.parametrize("supplier,artifact_rel,expected_rel", CASES)
+def test_tables_sharing_a_page_are_extracted_once(
+    supplier: str, artifact_rel: str, expected_rel: str
+):
+    config = load_supplier_config(supplier)
+    artifact_path = SNAPSHOT_ROOT / artifact_rel
+    stats = PdfParseStats()
+    rows = parse_pdf(
+        config,
+        artifact_path,
+        observed_at=datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        source_checksum=sha256(artifact_path.read_bytes()).hexdigest(),
+        stats=stats,
+    )
+    pages = {table.page for table in config.pdf.tables}
+    assert stats.extractions == len(pages)
+    assert stats.cache_hits == len(config.pdf.tables) - len(pages)
+    assert rows == json.loads((SNAPSHOT_ROOT / expected_rel).read_text(encoding="utf-8"))
+
+
+def test_low_memory_mode_loads_and_releases_only_referenced_pages():
+    config = load_supplier_config("engie")
+    artifact_path = SNAPSHOT_ROOT / "engie/engie_reference.pdf"
+    kwargs = {
+        "observed_at": datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        "source_checksum": sha256(artifact_path.read_bytes()).hexdigest(),
+    }
+
+    full = PdfParseStats()
+    expected = parse_pdf(
+        config, artifact_path, stats=full, low_memory=False, trace_memory=True, **kwargs
+    )
+    bounded = PdfParseStats()
+    rows = parse_pdf(config, artifact_path, stats=bounded, trace_memory=True, **kwargs)
+
+    assert rows == expected
+    assert full.pages_opened > bounded.pages_opened == 1
+    assert bounded.pages_released == 1
+    assert bounded.peak_traced_kib > 0 and full.peak_traced_kib > 0
+
+
+def test_bbox_crop_selects_the_table_without_relying_on_page_index():
+    config = load_supplier_config("edf")
+    artifact_path = SNAPSHOT_ROOT / "edf/edf_tarif_bleu.pdf"
+    kwargs = {
+        "observed_at": datetime.fromisoformat("2025-02-12T08:00:00+00:00"),
+        "source_checksum": sha256(artifact_path.read_bytes()).hexdigest(),
+    }
+    # Right-hand HP/HC grid of the EDF page, picked by position instead of table_index=1.
+    hphc = config.pdf.tables[1].model_copy(
+        update={
+            "table_index": 0,
+            "bbox": (340.0, 285.0, 530.0, 455.0),
+            "table_settings": {"vertical_strategy": "lines", "horizontal_strategy": "lines"},
+        }
+    )
+    cropped = config.model_copy(
+        update={"pdf": config.pdf.model_copy(update={"tables": [config.pdf.tables[0], hphc]})}
+    )
+
+    assert parse_pdf(cropped, artifact_path, **kwargs) == parse_pdf(config, artifact_path, **kwargs)
+
+
+def test_bbox_must_be_ordered():
+    with pytest.raises(ValueError):
+        PdfTableConfig(page=0, bbox=(100, 50, 10, 400), slices=[])
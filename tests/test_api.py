@@ -85,3 +85,17 @@ def test_admin_inspect_pdf(client, tmp_path):
     body = response.json()
     assert body["count"] >= 1
     assert len(body["items"]) >= 1
+
+
+def test_compare_ranks_offers_for_a_profile(client):
+    response = client.get("/v1/compare", params={"consumption_kwh": 5000, "top": 2})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["profile"]["consumption_kwh"] == 5000
+    assert 0 < len(payload["items"]) <= 2
+    costs = [item["annual_cost_eur"] for item in payload["items"]]
+    assert costs == sorted(costs)
+
+    assert client.get("/v1/compare", params={"consumption_kwh": 0}).status_code == 422
+    invalid_puissance = {"consumption_kwh": 5000, "puissance": 4}
+    assert client.get("/v1/compare", params=invalid_puissance).status_code == 422
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import csv
+import io
+import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from api.app.core import config as config_module
@@ -12,6 +16,7 @@ from api.app.db import models
 from api.app.db.base import Base
 from api.app.db import session as session_module
 from api.app.models.enums import FreshnessStatus, TariffOption
+from api.app.services import compare_service, tariff_service
 
 
 @pytest.fixture
@@ -78,6 +83,9 @@ def seeded_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     monkeypatch.setattr(session_module, "_engine", engine, raising=False)
     monkeypatch.setattr(session_module, "_session_factory", session_factory, raising=False)
     monkeypatch.setattr(config_module.settings, "enable_db", True)
+    # Each test gets a fresh database: drop results cached from the previous one.
+    tariff_service.tariff_cache.invalidate()
+    compare_service.compare_cache.invalidate()
     monkeypatch.setattr(config_module.settings, "database_url", database_url)
 
     yield
@@ -146,3 +154,155 @@ def test_admin_override_crud_db(seeded_db, client):
     assert history.status_code == 200
     items = history.json()["items"]
     assert any(entry["id"] == created["id"] for entry in items)
+
+
+def test_unchanged_run_keeps_observation_fresh(seeded_db, client):
+    async def _record_unchanged_run():
+        async with session_module.get_session_factory()() as session:
+            session.add(
+                models.IngestRun(
+                    supplier="Engie",
+                    status="unchanged",
+                    started_at=datetime.now(timezone.utc),
+                    finished_at=datetime.now(timezone.utc),
+                    source_url="https://legacy.engie.fr/tarifs",
+                    source_checksum="0123456789abcdef" * 4,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(_record_unchanged_run())
+    response = client.get("/v1/tariffs")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    # The 40-day-old observation was re-verified by an unchanged run, so it is no longer stale.
+    assert len(items) == 2
+    legacy = next(item for item in items if item["source_url"] == "https://legacy.engie.fr/tarifs")
+    assert legacy["data_status"] == FreshnessStatus.FRESH.value
+    assert legacy["last_verified"] is not None
+
+
+def test_latest_tariffs_returns_one_row_per_offer(seeded_db, client):
+    async def _add_older_observations():
+        async with session_module.get_session_factory()() as session:
+            supplier_id = (await session.execute(select(models.Supplier.id))).scalar_one()
+            for days in (5, 9):
+                session.add(
+                    models.Tariff(
+                        supplier_id=supplier_id,
+                        option=TariffOption.HPHC,
+                        puissance_kva=9,
+                        price_kwh_hp_ttc=0.19,
+                        price_kwh_hc_ttc=0.17,
+                        abo_month_ttc=39.5,
+                        observed_at=datetime.now(timezone.utc) - timedelta(days=days),
+                        parser_version="engie_pdf_v1",
+                        source_url=(
+                            "https://particuliers.engie.fr/content/dam/pdf/"
+                            "fiches-descriptives/fiche-descriptive-elec-reference-3-ans.pdf"
+                        ),
+                        source_checksum="a" * 64,
+                    )
+                )
+            await session.commit()
+
+    asyncio.run(_add_older_observations())
+    response = client.get("/v1/tariffs", params={"include_stale": True})
+    assert response.status_code == 200
+    items = response.json()["items"]
+    # Older observations of the same offer are history, not extra offers.
+    assert len(items) == 2
+    current = next(item for item in items if "engie.fr/content" in item["source_url"])
+    assert current["abo_month_ttc"] == 38.95
+
+
+def test_tariff_routes_answer_conditional_requests(seeded_db, client):
+    first = client.get("/v1/tariffs")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public, max-age=")
+    assert "last-modified" in first.headers
+
+    revalidated = client.get("/v1/tariffs", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    since = client.get("/v1/tariffs", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert since.status_code == 304
+
+    other_filter = client.get("/v1/tariffs", params={"include_stale": True})
+    assert other_filter.headers["etag"] != etag
+
+    history = client.get("/v1/tariffs/history", params={"option": "HPHC"})
+    assert history.status_code == 200
+    assert (
+        client.get(
+            "/v1/tariffs/history",
+            params={"option": "HPHC"},
+            headers={"If-None-Match": history.headers["etag"]},
+        ).status_code
+        == 304
+    )
+
+
+def test_backfilled_rows_move_last_modified(seeded_db, client):
+    first = client.get("/v1/tariffs/history")
+    assert first.status_code == 200 and len(first.json()["items"]) == 2
+
+    async def _backfill():
+        async with session_module.get_session_factory()() as session:
+            supplier_id = (await session.execute(select(models.Supplier.id))).scalar_one()
+            session.add(
+                models.Tariff(
+                    supplier_id=supplier_id,
+                    option=TariffOption.BASE,
+                    puissance_kva=6,
+                    price_kwh_ttc=0.2516,
+                    abo_month_ttc=15.5,
+                    # Older than every row already served: max(observed_at) does not move.
+                    observed_at=datetime.now(timezone.utc) - timedelta(days=100),
+                    parser_version="engie_pdf_v0",
+                    source_url="https://legacy.engie.fr/tarifs",
+                    source_checksum="b" * 64,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(_backfill())
+    tariff_service.tariff_cache.invalidate()
+
+    since = client.get(
+        "/v1/tariffs/history", headers={"If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert since.status_code == 200
+    assert len(since.json()["items"]) == 3
+    assert since.headers["etag"] != first.headers["etag"]
+    assert since.headers["last-modified"] != first.headers["last-modified"]
+
+
+def test_tariff_history_paginates_with_keyset_cursor(seeded_db, client):
+    first = client.get("/v1/tariffs/history", params={"limit": 1}).json()
+    assert len(first["items"]) == 1 and first["next_cursor"]
+
+    second = client.get(
+        "/v1/tariffs/history", params={"limit": 1, "cursor": first["next_cursor"]}
+    ).json()
+    assert len(second["items"]) == 1 and second["next_cursor"] is None
+    assert second["items"][0]["observed_at"] < first["items"][0]["observed_at"]
+
+    invalid = client.get("/v1/tariffs/history", params={"cursor": "not-a-cursor"})
+    assert invalid.status_code == 400
+
+
+def test_tariff_history_streams_ndjson_and_csv(seeded_db, client):
+    ndjson = client.get("/v1/tariffs/history", params={"format": "ndjson"})
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [line["abo_month_ttc"] for line in lines] == [38.95, 40.12]
+
+    csv_export = client.get("/v1/tariffs/history", params={"format": "csv"})
+    assert csv_export.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(csv_export.text)))
+    assert [row["source_url"] for row in rows] == [line["source_url"] for line in lines]
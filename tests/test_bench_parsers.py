@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.bench_parsers import compare, discover_cases
+
+
+def _entry(supplier: str, wall: float, memory: float = 1000.0, rows: int = 10) -> dict:
+    return {
+        "supplier": supplier,
+        "artifact": f"tests/snapshots/{supplier}.pdf",
+        "rows": rows,
+        "wall_median_s": wall,
+        "cpu_median_s": wall,
+        "peak_memory_kib": memory,
+    }
+
+
+def test_discover_cases_maps_snapshots_to_configs():
+    cases = {case.supplier: case.artifact_path for case in discover_cases(Path("tests/snapshots"))}
+    assert cases["edf"] == Path("tests/snapshots/edf/edf_tarif_bleu.pdf")
+    assert cases["total_heures_eco"] == Path("tests/snapshots/total/total_heures_eco.pdf")
+    # The TRVE grid is imported by a dedicated script, not a supplier config.
+    assert not any("trve" in str(path) for path in cases.values())
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = [_entry("edf", 0.50), _entry("engie", 0.40)]
+    current = [
+        _entry("edf", 0.55),
+        _entry("engie", 0.60, memory=2000.0, rows=9),
+        _entry("new_supplier", 9.0),
+    ]
+
+    regressions = compare(current, baseline, threshold=0.2)
+
+    assert not any(line.startswith("edf") for line in regressions)
+    assert {line.split(":")[0] for line in regressions} == {
+        "engie wall_median_s",
+        "engie cpu_median_s",
+        "engie peak_memory_kib",
+        "engie rows",
+    }
@@ -54,7 +54,7 @@ export interface AdminSection {
 export interface SupplierHealthStatus {
   supplier: string;
   last_run_at: string | null;
-  last_run_status: "success" | "failed" | "running" | "source_unavailable" | null;
+  last_run_status: "success" | "failed" | "running" | "source_unavailable" | "unchanged" | null;
   last_success_at: string | null;
   rows_last_inserted: number;
   data_status: "fresh" | "stale" | "verifying" | "broken";